@@ -2,30 +2,36 @@
 
 __version__ = "0.1.0"
 
+import importlib
+
 from geodatarev.config import FormatConfig, load_config
-from geodatarev.identifier import FileIdentifier
+from geodatarev.identifier import FileIdentifier, get_default_identifier, identify_file
 from geodatarev.analyzer import BinaryAnalyzer
-from geodatarev.scanner import DirectoryScanner
 from geodatarev.disambiguate import classify_dat, classify_grd
-from geodatarev.cloud_storage import (
-    CloudStorageProvider,
-    S3StorageProvider,
-    AzureBlobStorageProvider,
-    is_cloud_uri,
-    parse_cloud_uri,
-    get_provider,
-)
-from geodatarev.gdal_compat import (
-    check_gdal_available,
-    try_gdal_open,
-    get_old_gdal_strategy,
-    GDALCheckResult,
-)
+
+#: Re-exports resolved lazily via PEP 562: the scanner pulls in every
+#: parser, and the cloud/GDAL modules are only needed by a subset of
+#: commands, so `import geodatarev` stays cheap for the rest.
+_LAZY_EXPORTS = {
+    "DirectoryScanner": "geodatarev.scanner",
+    "CloudStorageProvider": "geodatarev.cloud_storage",
+    "S3StorageProvider": "geodatarev.cloud_storage",
+    "AzureBlobStorageProvider": "geodatarev.cloud_storage",
+    "is_cloud_uri": "geodatarev.cloud_storage",
+    "parse_cloud_uri": "geodatarev.cloud_storage",
+    "get_provider": "geodatarev.cloud_storage",
+    "check_gdal_available": "geodatarev.gdal_compat",
+    "try_gdal_open": "geodatarev.gdal_compat",
+    "get_old_gdal_strategy": "geodatarev.gdal_compat",
+    "GDALCheckResult": "geodatarev.gdal_compat",
+}
 
 __all__ = [
     "FormatConfig",
     "load_config",
     "FileIdentifier",
+    "get_default_identifier",
+    "identify_file",
     "BinaryAnalyzer",
     "DirectoryScanner",
     "classify_dat",
@@ -41,3 +47,14 @@ __all__ = [
     "get_old_gdal_strategy",
     "GDALCheckResult",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is not None:
+        return getattr(importlib.import_module(module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
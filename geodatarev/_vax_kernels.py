@@ -0,0 +1,111 @@
+"""Optional numba-compiled kernels for VAX float conversion.
+
+With numba installed (the ``jit`` extra), the word swap, bitfield
+reassembly and exponent rebias for a whole VAX buffer fuse into one
+native pass instead of the chain of numpy temporaries in
+:mod:`geodatarev.float_formats`.  Importing this module never raises:
+without numba the exported converters are ``None`` and the numpy
+kernels stay in charge.
+
+Each njit kernel emits IEEE bit patterns into an unsigned output array;
+the wrappers reinterpret those bits as floats, so results stay
+bit-identical to the scalar converters.
+"""
+
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _f_bits(w, out):  # pragma: no cover - needs numba
+        for i in numba.prange(w.shape[0]):
+            u = np.int64(w[i])
+            # Middle-endian: swap the two 16-bit halves of each word
+            raw = ((u & 0xFFFF) << 16) | (u >> 16)
+            sign = (raw >> 15) & 1
+            exponent = (raw >> 7) & 0xFF
+            fraction = ((raw & 0x7F) << 16) | ((raw >> 16) & 0xFFFF)
+            ieee_exp = exponent - 2
+            if exponent == 0 or ieee_exp <= 0:
+                # Zero, reserved operand, and underflow collapse to 0.0
+                out[i] = 0
+            else:
+                if ieee_exp >= 0xFF:
+                    ieee_exp = 0xFE
+                out[i] = (sign << 31) | (ieee_exp << 23) | fraction
+
+    @numba.njit(cache=True, parallel=True)
+    def _d_bits(w, out):  # pragma: no cover - needs numba
+        lane_mask = np.uint64(0x0000FFFF0000FFFF)
+        for i in numba.prange(w.shape[0]):
+            u = w[i]
+            raw = ((u & lane_mask) << np.uint64(16)) | \
+                ((u >> np.uint64(16)) & lane_mask)
+            sign = (raw >> np.uint64(15)) & np.uint64(1)
+            exponent = np.int64((raw >> np.uint64(7)) & np.uint64(0xFF))
+            frac_hi = raw & np.uint64(0x7F)
+            frac_lo = (raw >> np.uint64(16)) & np.uint64(0xFFFFFFFFFFFF)
+            fraction = (frac_hi << np.uint64(48)) | frac_lo
+            # VAX bias 128 -> IEEE bias 1023, minus 1 for normalisation
+            ieee_exp = exponent + (1023 - 128 - 1)
+            if exponent == 0 or ieee_exp <= 0:
+                out[i] = np.uint64(0)
+            else:
+                if ieee_exp >= 0x7FF:
+                    ieee_exp = 0x7FE
+                out[i] = (sign << np.uint64(63)) | \
+                    (np.uint64(ieee_exp) << np.uint64(52)) | \
+                    (fraction >> np.uint64(3))
+
+    @numba.njit(cache=True, parallel=True)
+    def _g_bits(w, out):  # pragma: no cover - needs numba
+        lane_mask = np.uint64(0x0000FFFF0000FFFF)
+        for i in numba.prange(w.shape[0]):
+            u = w[i]
+            raw = ((u & lane_mask) << np.uint64(16)) | \
+                ((u >> np.uint64(16)) & lane_mask)
+            sign = (raw >> np.uint64(15)) & np.uint64(1)
+            exponent = np.int64((raw >> np.uint64(4)) & np.uint64(0x7FF))
+            frac_hi = raw & np.uint64(0xF)
+            frac_lo = (raw >> np.uint64(16)) & np.uint64(0xFFFFFFFFFFFF)
+            fraction = (frac_hi << np.uint64(48)) | frac_lo
+            ieee_exp = exponent - 2
+            if exponent == 0 or ieee_exp <= 0:
+                out[i] = np.uint64(0)
+            else:
+                if ieee_exp >= 0x7FF:
+                    ieee_exp = 0x7FE
+                out[i] = (sign << np.uint64(63)) | \
+                    (np.uint64(ieee_exp) << np.uint64(52)) | fraction
+
+    def vax_f_array(data: bytes):  # pragma: no cover - needs numba
+        """Convert a run of VAX F_floating values to IEEE ``float32``."""
+        w = np.frombuffer(data, dtype="<u4")
+        out = np.empty(w.shape[0], dtype=np.uint32)
+        _f_bits(w, out)
+        return out.view(np.float32)
+
+    def vax_d_array(data: bytes):  # pragma: no cover - needs numba
+        """Convert a run of VAX D_floating values to IEEE ``float64``."""
+        w = np.frombuffer(data, dtype="<u8")
+        out = np.empty(w.shape[0], dtype=np.uint64)
+        _d_bits(w, out)
+        return out.view(np.float64)
+
+    def vax_g_array(data: bytes):  # pragma: no cover - needs numba
+        """Convert a run of VAX G_floating values to IEEE ``float64``."""
+        w = np.frombuffer(data, dtype="<u8")
+        out = np.empty(w.shape[0], dtype=np.uint64)
+        _g_bits(w, out)
+        return out.view(np.float64)
+
+else:
+    vax_f_array = None
+    vax_d_array = None
+    vax_g_array = None
@@ -3,14 +3,43 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
 
+from geodatarev.analyzer import BinaryAnalyzer
+from geodatarev.cloud_storage import is_cloud_uri
 from geodatarev.config import load_config
+from geodatarev.gdal_compat import (
+    check_gdal_available,
+    get_old_gdal_strategy,
+    try_gdal_open,
+)
+from geodatarev.identifier import FileIdentifier, get_default_identifier
 from geodatarev.scanner import DirectoryScanner
 
+try:
+    import orjson
 
+    def _dumps(obj) -> str:
+        """Serialise *obj* to indented JSON (orjson fast path)."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:  # orjson is an optional accelerator (the "fast" extra)
+    def _dumps(obj) -> str:
+        """Serialise *obj* to indented JSON (stdlib fallback)."""
+        return json.dumps(obj, indent=2)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_analyzer() -> BinaryAnalyzer:
+    """Shared default analyzer, reused across in-process CLI calls."""
+    return BinaryAnalyzer()
+
+
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="geodatarev",
@@ -103,8 +132,6 @@ def _report_to_dict(report) -> dict:
 
 def cmd_scan(args) -> int:
     """Execute the ``scan`` subcommand."""
-    from geodatarev.cloud_storage import is_cloud_uri
-
     configs = load_config(args.config)
     extensions = {e if e.startswith(".") else f".{e}" for e in (args.extensions or [])} or None
     scanner = DirectoryScanner(configs=configs, extensions=extensions,
@@ -113,19 +140,27 @@ def cmd_scan(args) -> int:
     target_str = args.path
 
     if is_cloud_uri(target_str):
-        reports = scanner.scan_cloud(target_str, recursive=args.recursive)
+        reports = iter(scanner.scan_cloud(target_str, recursive=args.recursive))
     else:
         target = Path(target_str)
         if target.is_file():
-            reports = [scanner.scan_file(target)]
+            reports = iter([scanner.scan_file(target)])
         elif target.is_dir():
-            reports = scanner.scan_directory(target, recursive=args.recursive)
+            reports = scanner.iter_directory(target, recursive=args.recursive)
         else:
             print(f"Error: {args.path} is not a valid file or directory", file=sys.stderr)
             return 1
 
+    # Emit reports one at a time so peak memory stays flat on big scans
     if args.output_json:
-        print(json.dumps([_report_to_dict(r) for r in reports], indent=2))
+        sys.stdout.write("[\n")
+        first = True
+        for r in reports:
+            if not first:
+                sys.stdout.write(",\n")
+            sys.stdout.write(_dumps(_report_to_dict(r)))
+            first = False
+        sys.stdout.write("\n]\n")
     else:
         for r in reports:
             _print_report(r)
@@ -135,10 +170,11 @@ def cmd_scan(args) -> int:
 
 def cmd_identify(args) -> int:
     """Execute the ``identify`` subcommand."""
-    from geodatarev.identifier import FileIdentifier
-
-    configs = load_config(args.config)
-    identifier = FileIdentifier(configs)
+    if args.config is None:
+        # The default registry's probe plan is built once per process
+        identifier = get_default_identifier()
+    else:
+        identifier = FileIdentifier(load_config(args.config))
     matches = identifier.identify_file(args.file)
     if matches:
         for m in matches:
@@ -156,10 +192,7 @@ def cmd_identify(args) -> int:
 
 def cmd_analyze(args) -> int:
     """Execute the ``analyze`` subcommand."""
-    from geodatarev.analyzer import BinaryAnalyzer
-
-    analyzer = BinaryAnalyzer()
-    result = analyzer.analyze_file(args.file)
+    result = _default_analyzer().analyze_file(args.file)
 
     if args.output_json:
         d = {
@@ -174,7 +207,7 @@ def cmd_analyze(args) -> int:
             "detected_patterns": result.detected_patterns[:10],
             "printable_strings": result.printable_strings[:20],
         }
-        print(json.dumps(d, indent=2))
+        print(_dumps(d))
     else:
         print(f"File size:        {result.file_size} bytes")
         print(f"Shannon entropy:  {result.entropy:.4f} bits/byte")
@@ -235,8 +268,6 @@ def _print_report(report) -> None:
 
 def cmd_gdal_check(args) -> int:
     """Execute the ``gdal-check`` subcommand."""
-    from geodatarev.gdal_compat import try_gdal_open, check_gdal_available
-
     status = check_gdal_available()
     if not status["available"]:
         print(f"GDAL not available: {status['error']}")
@@ -256,7 +287,7 @@ def cmd_gdal_check(args) -> int:
             "projection": result.projection,
             "error": result.error,
         }
-        print(json.dumps(d, indent=2))
+        print(_dumps(d))
     else:
         if result.can_read:
             print(f"GDAL can read: YES")
@@ -275,8 +306,6 @@ def cmd_gdal_check(args) -> int:
 
 def cmd_gdal_strategy(args) -> int:
     """Execute the ``gdal-strategy`` subcommand."""
-    from geodatarev.gdal_compat import get_old_gdal_strategy
-
     strategy = get_old_gdal_strategy()
 
     print("Strategies for obtaining old GDAL builds")
@@ -7,10 +7,12 @@ operate on remote data in the same way it handles local directories.
 
 from __future__ import annotations
 
+import operator
 import os
 import posixpath
 import tempfile
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator
 
@@ -50,23 +52,32 @@ def is_cloud_uri(path: str) -> bool:
     return path.startswith("s3://") or path.startswith("az://")
 
 
-@dataclass
+def _key_suffix(key: str) -> str:
+    """Lower-cased extension of *key*'s basename, e.g. ``'.grd'``."""
+    name = key[key.rfind("/") + 1:]
+    dot = name.rfind(".")
+    return name[dot:].lower() if dot > 0 else ""
+
+
+@dataclass(frozen=True)
 class CloudObject:
-    """Metadata for a single object in cloud storage."""
+    """Metadata for a single object in cloud storage.
+
+    ``name`` and ``suffix`` are computed once at construction rather
+    than re-scanning the key on every access — the listing filter hits
+    ``suffix`` for every object in a bucket.
+    """
 
     key: str
     size: int = 0
+    #: Basename of the key (like a filename).
+    name: str = field(init=False, default="")
+    #: File extension (lower-cased), e.g. ``'.grd'``.
+    suffix: str = field(init=False, default="")
 
-    @property
-    def name(self) -> str:
-        """Basename of the key (like a filename)."""
-        return posixpath.basename(self.key)
-
-    @property
-    def suffix(self) -> str:
-        """File extension (lower-cased), e.g. ``'.grd'``."""
-        _, ext = posixpath.splitext(self.key)
-        return ext.lower()
+    def __post_init__(self):
+        object.__setattr__(self, "name", posixpath.basename(self.key))
+        object.__setattr__(self, "suffix", _key_suffix(self.key))
 
 
 # ---------------------------------------------------------------------------
@@ -121,6 +132,70 @@ class CloudStorageProvider:
         """
         raise NotImplementedError
 
+    def download_bytes(self, bucket: str, key: str) -> bytes:
+        """Download an object into memory, without touching the filesystem.
+
+        Subclasses override this with a direct get-object call; the base
+        implementation round-trips through a temporary file.
+
+        Parameters
+        ----------
+        bucket : str
+            Bucket or container name.
+        key : str
+            Full object key.
+
+        Returns
+        -------
+        bytes
+            The object's contents.
+        """
+        with tempfile.TemporaryDirectory() as td:
+            local = self.download(bucket, key, Path(td) / posixpath.basename(key))
+            return local.read_bytes()
+
+    def download_many(
+        self,
+        bucket: str,
+        keys: list[str],
+        dest_dir: str | Path,
+        max_workers: int = 16,
+    ) -> list[Path]:
+        """Download several objects concurrently.
+
+        Transfers are I/O bound, so a thread pool recovers most of the
+        bandwidth a serial loop leaves on the table.  Each object lands
+        in *dest_dir* under its basename.
+
+        Parameters
+        ----------
+        bucket : str
+            Bucket or container name.
+        keys : list[str]
+            Object keys to download.
+        dest_dir : str or Path
+            Local destination directory.
+        max_workers : int
+            Maximum concurrent transfers.
+
+        Returns
+        -------
+        list[Path]
+            Local paths, in the same order as *keys*.
+        """
+        dest_dir = Path(dest_dir)
+        if not keys:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            return list(
+                pool.map(
+                    lambda key: self.download(
+                        bucket, key, dest_dir / posixpath.basename(key)
+                    ),
+                    keys,
+                )
+            )
+
 
 # ---------------------------------------------------------------------------
 # AWS S3
@@ -149,23 +224,104 @@ class S3StorageProvider(CloudStorageProvider):
         prefix: str = "",
         recursive: bool = True,
         extensions: set[str] | None = None,
+        parallel: bool = False,
     ) -> list[CloudObject]:
-        paginator = self._client.get_paginator("list_objects_v2")
+        if extensions is not None:
+            extensions = {e.lower() for e in extensions}
+
+        if parallel and recursive:
+            return self.list_objects_parallel(
+                bucket, prefix, extensions=extensions
+            )
+
         params: dict = {"Bucket": bucket, "Prefix": prefix}
         if not recursive:
             params["Delimiter"] = "/"
 
+        # ListObjectsV2 returns keys in ascending UTF-8 binary order, both
+        # within and across pages, so no final sort is needed
+        return self._paginate(params, extensions)
+
+    def list_objects_parallel(
+        self,
+        bucket: str,
+        prefix: str = "",
+        extensions: set[str] | None = None,
+        max_workers: int = 32,
+    ) -> list[CloudObject]:
+        """List objects recursively with pagination fanned out per sub-prefix.
+
+        A single pager pipeline tops out at ~1000 keys per request; for
+        very wide buckets, one ``ListObjectsV2`` probe with a delimiter
+        discovers the first-level sub-prefixes and a paginator runs for
+        each concurrently.  Falls back to a serial listing when the
+        prefix has no sub-prefixes.
+
+        Parameters
+        ----------
+        bucket : str
+            Bucket name.
+        prefix : str
+            Key prefix (folder path).
+        extensions : set[str] or None
+            If given, only include objects whose suffix is in the set.
+        max_workers : int
+            Maximum concurrent listing threads.
+
+        Returns
+        -------
+        list[CloudObject]
+            Objects sorted by key.
+        """
+        # The delimiter probe must itself paginate: CommonPrefixes and
+        # Contents are jointly capped at ~1000 entries per response, and
+        # wide prefixes are exactly the case this method exists for
+        paginator = self._client.get_paginator("list_objects_v2")
+        sub_prefixes: list[str] = []
+        objects: list[CloudObject] = []
+        for page in paginator.paginate(
+            Bucket=bucket, Prefix=prefix, Delimiter="/"
+        ):
+            sub_prefixes.extend(
+                cp["Prefix"] for cp in page.get("CommonPrefixes", [])
+            )
+            # Keys sitting directly under the prefix come from the probe
+            objects.extend(self._collect_page(page, extensions))
+
+        if not sub_prefixes:
+            # No sub-prefixes means the probe already listed every key
+            return objects
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sub_prefixes))) as pool:
+            futures = [
+                pool.submit(self._paginate, {"Bucket": bucket, "Prefix": sp}, extensions)
+                for sp in sub_prefixes
+            ]
+            for future in futures:
+                objects.extend(future.result())
+
+        objects.sort(key=operator.attrgetter("key"))
+        return objects
+
+    def _paginate(self, params: dict, extensions: set[str] | None) -> list[CloudObject]:
+        """Run one ListObjectsV2 pager pipeline and collect the objects."""
+        paginator = self._client.get_paginator("list_objects_v2")
         objects: list[CloudObject] = []
         for page in paginator.paginate(**params):
-            for item in page.get("Contents", []):
-                key: str = item["Key"]
-                if key.endswith("/"):
-                    continue
-                obj = CloudObject(key=key, size=item.get("Size", 0))
-                if extensions is not None and obj.suffix not in extensions:
-                    continue
-                objects.append(obj)
-        objects.sort(key=lambda o: o.key)
+            objects.extend(self._collect_page(page, extensions))
+        return objects
+
+    @staticmethod
+    def _collect_page(page: dict, extensions: set[str] | None) -> list[CloudObject]:
+        """Extract CloudObjects from a single ListObjectsV2 response page."""
+        objects: list[CloudObject] = []
+        for item in page.get("Contents", []):
+            key: str = item["Key"]
+            if key.endswith("/"):
+                continue
+            if extensions is not None and _key_suffix(key) not in extensions:
+                continue
+            objects.append(CloudObject(key=key, size=item.get("Size", 0)))
         return objects
 
     def download(self, bucket: str, key: str, dest: str | Path) -> Path:
@@ -174,6 +330,47 @@ class S3StorageProvider(CloudStorageProvider):
         self._client.download_file(bucket, key, str(dest))
         return dest
 
+    def download_bytes(self, bucket: str, key: str) -> bytes:
+        """Fetch an object straight into memory via GetObject."""
+        response = self._client.get_object(Bucket=bucket, Key=key)
+        return response["Body"].read()
+
+    def download_many(
+        self,
+        bucket: str,
+        keys: list[str],
+        dest_dir: str | Path,
+        max_workers: int = 16,
+    ) -> list[Path]:
+        """Download several objects concurrently.
+
+        On top of the generic thread pool, each transfer uses a
+        ``TransferConfig`` so large objects are themselves fetched with
+        concurrent multipart range requests.
+        """
+        try:
+            from boto3.s3.transfer import TransferConfig
+        except ImportError:
+            return super().download_many(bucket, keys, dest_dir, max_workers)
+
+        config = TransferConfig(
+            max_concurrency=max_workers,
+            multipart_threshold=8 * 1024 * 1024,
+            use_threads=True,
+        )
+        dest_dir = Path(dest_dir)
+        if not keys:
+            return []
+
+        def _fetch(key: str) -> Path:
+            dest = dest_dir / posixpath.basename(key)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            self._client.download_file(bucket, key, str(dest), Config=config)
+            return dest
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            return list(pool.map(_fetch, keys))
+
 
 # ---------------------------------------------------------------------------
 # Azure Blob Storage
@@ -205,6 +402,9 @@ class AzureBlobStorageProvider(CloudStorageProvider):
         recursive: bool = True,
         extensions: set[str] | None = None,
     ) -> list[CloudObject]:
+        if extensions is not None:
+            extensions = {e.lower() for e in extensions}
+
         container_client = self._client.get_container_client(bucket)
 
         if recursive:
@@ -222,11 +422,12 @@ class AzureBlobStorageProvider(CloudStorageProvider):
             key: str = blob.name
             if key.endswith("/"):
                 continue
-            obj = CloudObject(key=key, size=blob.size or 0)
-            if extensions is not None and obj.suffix not in extensions:
+            if extensions is not None and _key_suffix(key) not in extensions:
                 continue
-            objects.append(obj)
-        objects.sort(key=lambda o: o.key)
+            objects.append(CloudObject(key=key, size=blob.size or 0))
+        # Blob listings are usually lexical already, so this is near O(N);
+        # kept because walk_blobs interleaves prefixes in non-recursive mode
+        objects.sort(key=operator.attrgetter("key"))
         return objects
 
     def download(self, bucket: str, key: str, dest: str | Path) -> Path:
@@ -234,10 +435,18 @@ class AzureBlobStorageProvider(CloudStorageProvider):
         dest.parent.mkdir(parents=True, exist_ok=True)
         blob_client = self._client.get_blob_client(container=bucket, blob=key)
         with open(dest, "wb") as fh:
-            stream = blob_client.download_blob()
-            fh.write(stream.readall())
+            # Stream chunk by chunk so memory stays constant regardless of
+            # blob size, and disk writes overlap the network transfer
+            stream = blob_client.download_blob(max_concurrency=8)
+            for chunk in stream.chunks():
+                fh.write(chunk)
         return dest
 
+    def download_bytes(self, bucket: str, key: str) -> bytes:
+        """Fetch a blob straight into memory."""
+        blob_client = self._client.get_blob_client(container=bucket, blob=key)
+        return blob_client.download_blob(max_concurrency=8).readall()
+
 
 # ---------------------------------------------------------------------------
 # Factory
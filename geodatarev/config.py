@@ -6,13 +6,47 @@ header structures, data types, and endianness for legacy binary formats.
 
 from __future__ import annotations
 
+import functools
 import os
+import struct
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml C binding: 5-10x faster parse when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Struct format characters for the fixed-size IEEE dtypes.  Anything else
+# (ascii, bytes, legacy VAX/IBM floats) is kept as raw bytes in a compiled
+# header and decoded afterwards.
+_STRUCT_CHARS = {
+    "uint8": "B", "int8": "b",
+    "uint16": "H", "int16": "h",
+    "uint32": "I", "int32": "i",
+    "uint64": "Q", "int64": "q",
+    "float32": "f", "float64": "d",
+}
+
+_ENDIAN_PREFIX = {"little": "<", "big": ">", "middle": "<"}
+
+# Bit widths of every supported payload dtype, hoisted to module scope so
+# data_bit_width is a single dict lookup per access
+_DTYPE_BIT_WIDTHS = {
+    "uint8": 8, "int8": 8,
+    "uint16": 16, "int16": 16,
+    "uint32": 32, "int32": 32,
+    "uint64": 64, "int64": 64,
+    "float32": 32, "float64": 64,
+    "vax_f": 32, "ibm_float32": 32,
+    "vax_d": 64, "vax_g": 64, "ibm_float64": 64,
+}
+
 
 @dataclass
 class FieldDefinition:
@@ -48,16 +82,49 @@ class FormatConfig:
     @property
     def data_bit_width(self) -> int:
         """Return the bit width of the data payload type."""
-        dtype_sizes = {
-            "uint8": 8, "int8": 8,
-            "uint16": 16, "int16": 16,
-            "uint32": 32, "int32": 32,
-            "uint64": 64, "int64": 64,
-            "float32": 32, "float64": 64,
-            "vax_f": 32, "ibm_float32": 32,
-            "vax_d": 64, "vax_g": 64, "ibm_float64": 64,
-        }
-        return dtype_sizes.get(self.data_dtype, 0)
+        return _DTYPE_BIT_WIDTHS.get(self.data_dtype, 0)
+
+    @functools.cached_property
+    def _compiled_header(self) -> struct.Struct:
+        parts = [_ENDIAN_PREFIX.get(self.endian, "<")]
+        pos = 0
+        for f in sorted(self.fields, key=lambda f: f.offset):
+            if f.offset < pos:
+                raise ValueError(
+                    f"Overlapping header fields in format {self.name!r} "
+                    f"at offset {f.offset}"
+                )
+            if f.offset > pos:
+                parts.append(f"{f.offset - pos}x")
+            char = _STRUCT_CHARS.get(f.dtype)
+            if char is None or struct.calcsize(char) != f.size:
+                # ascii/bytes/legacy floats come back raw for post-processing
+                char = f"{f.size}s"
+            parts.append(char)
+            pos = f.offset + f.size
+        return struct.Struct("".join(parts))
+
+    def compile_header(self) -> struct.Struct:
+        """Return a single precompiled Struct covering all header fields.
+
+        Fields are laid out by offset with ``x`` padding over gaps, so a
+        whole-header parse is one C-level ``unpack_from`` instead of one
+        ``decode_value`` call per field.  Values come back in ascending
+        offset order; non-IEEE dtypes (``ascii``, ``bytes``, VAX/IBM
+        floats) appear as raw byte strings.  The compiled Struct is
+        cached on the instance.
+
+        Note that ``"middle"`` endian headers compile as little-endian;
+        the caller must reorder those bytes first (see
+        :func:`geodatarev.float_formats.reorder_array`).
+
+        Raises
+        ------
+        ValueError
+            If two fields overlap, which a single format string cannot
+            express.
+        """
+        return self._compiled_header
 
 
 def _parse_magic_bytes(value: str | list | None) -> bytes:
@@ -102,9 +169,27 @@ def _parse_format(data: dict) -> FormatConfig:
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> tuple[FormatConfig, ...]:
+    """Parse a YAML config file once per (path, mtime) combination.
+
+    The mtime key makes the cache self-invalidating: editing the file
+    changes ``st_mtime_ns`` and forces a fresh parse.
+    """
+    with open(path_str, "r") as fh:
+        data = yaml.load(fh, Loader=_YamlLoader)
+
+    formats = data.get("formats", [])
+    return tuple(_parse_format(f) for f in formats)
+
+
 def load_config(path: str | Path | None = None) -> list[FormatConfig]:
     """Load format configurations from a YAML file.
 
+    Results are cached per file, so repeated calls (one per scanned
+    file, in the worst case) parse the YAML only once per process until
+    the file changes on disk.
+
     Parameters
     ----------
     path : str or Path, optional
@@ -121,8 +206,5 @@ def load_config(path: str | Path | None = None) -> list[FormatConfig]:
     else:
         path = Path(path)
 
-    with open(path, "r") as fh:
-        data = yaml.safe_load(fh)
-
-    formats = data.get("formats", [])
-    return [_parse_format(f) for f in formats]
+    mtime_ns = os.stat(path).st_mtime_ns
+    return list(_load_config_cached(str(path), mtime_ns))
@@ -7,9 +7,31 @@ determine the most likely format.
 
 from __future__ import annotations
 
+import re
+import struct
 from pathlib import Path
 from typing import Any
 
+# A line consisting solely of numeric tokens (int/float/exponent form)
+# separated by spaces, tabs, or commas.  One C-level scan of this regex
+# replaces per-token float() calls in the ASCII XYZ heuristic.
+_NUMERIC_LINE_RE = re.compile(
+    rb"^[ \t,]*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+    rb"(?:[ \t,]+[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)*[ \t,\r]*$",
+    re.M,
+)
+
+# Surfer grids are identified by a single 4-byte magic lookup
+_GRD_MAGIC = {
+    b"DSAA": "Surfer ASCII Grid",
+    b"DSBB": "Surfer 6 Binary Grid",
+    b"DSRB": "Surfer 7 Binary Grid",
+}
+
+# Precompiled structs for the Geosoft 512-byte header heuristic
+_GEOSOFT_HDR = struct.Struct("<5i")
+_GEOSOFT_ZMULT = struct.Struct("<d")
+
 
 def classify_dat(data: bytes, path: Path | None = None) -> str:
     """Classify a ``.dat`` file by inspecting its content.
@@ -17,7 +39,7 @@ def classify_dat(data: bytes, path: Path | None = None) -> str:
     Returns a format label string. Checks are ordered from most
     specific to least specific.
     """
-    text = data[:4096].decode("ascii", errors="ignore")
+    head = data[:4096]
 
     # ASEG-GDF2: companion .dfn file
     if path is not None:
@@ -25,12 +47,14 @@ def classify_dat(data: bytes, path: Path | None = None) -> str:
         if dfn.exists():
             return "ASEG-GDF2"
 
-    # ZMap+: @ delimiters and ! comments
-    if "@" in text[:2048] and ("!" in text[:512] or "HEADER" in text[:2048].upper()):
+    # ZMap+: @ delimiters and ! comments (checked on raw bytes, no decode)
+    if head.find(b"@", 0, 2048) != -1 and (
+        head.find(b"!", 0, 512) != -1 or b"HEADER" in head[:2048].upper()
+    ):
         return "ZMap+"
 
     # Res2DInv: first non-blank line is a title, second is an integer (array type)
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    lines = [l.strip() for l in head.splitlines() if l.strip()]
     if len(lines) >= 3:
         try:
             int(lines[1])
@@ -43,16 +67,11 @@ def classify_dat(data: bytes, path: Path | None = None) -> str:
     if data[:4] == b"RFLX" or data[:6] == b"REFLEXW":
         return "ReflexW"
 
-    # Tab/comma/space delimited numeric columns (generic XYZ)
-    numeric_lines = 0
-    for line in lines[:20]:
-        tokens = line.replace(",", " ").split()
-        try:
-            [float(t) for t in tokens]
-            numeric_lines += 1
-        except ValueError:
-            pass
-    if numeric_lines >= 10:
+    # Tab/comma/space delimited numeric columns (generic XYZ): one regex
+    # match per line replaces float()-ing every token.  Only the first
+    # 20 non-blank lines vote, so a numeric table buried deeper in some
+    # other text format does not flip the classification.
+    if sum(1 for line in lines[:20] if _NUMERIC_LINE_RE.match(line)) >= 10:
         return "Generic ASCII XYZ"
 
     return "Unknown .dat"
@@ -66,14 +85,9 @@ def classify_grd(data: bytes, path: Path | None = None) -> str:
     if len(data) < 4:
         return "Unknown .grd (too small)"
 
-    magic4 = data[:4]
-
-    if magic4 == b"DSAA":
-        return "Surfer ASCII Grid"
-    if magic4 == b"DSBB":
-        return "Surfer 6 Binary Grid"
-    if magic4 == b"DSRB":
-        return "Surfer 7 Binary Grid"
+    hit = _GRD_MAGIC.get(data[:4])
+    if hit:
+        return hit
 
     # Geosoft: companion .grd.gi file
     if path is not None:
@@ -87,15 +101,14 @@ def classify_grd(data: bytes, path: Path | None = None) -> str:
 
     # Geosoft heuristic: 512-byte header with valid ES/SF/KX
     if len(data) >= 512:
-        import struct
         try:
-            es, sf, ne, nv, kx = struct.unpack_from("<5i", data, 0)
+            es, sf, ne, nv, kx = _GEOSOFT_HDR.unpack_from(data, 0)
             if (es in (1, 2, 4, 8, 1025, 1026, 1028, 1032)
                     and sf in (0, 1, 2)
                     and kx in (-1, 1)
                     and 0 < ne < 1_000_000
                     and 0 < nv < 1_000_000):
-                zmult = struct.unpack_from("<d", data, 68)[0]
+                zmult = _GEOSOFT_ZMULT.unpack_from(data, 68)[0]
                 if zmult != 0:
                     return "Geosoft Binary Grid"
         except struct.error:
@@ -7,7 +7,35 @@ little-endian, big-endian, and middle-endian (PDP-11) byte orders.
 
 from __future__ import annotations
 
+import array
+import functools
 import struct
+from math import ldexp
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
+#: Below this element count the per-element scalar decoders win over the
+#: vectorized kernels (ufunc dispatch overhead dominates small batches).
+_VECTOR_MIN_N = 64
+
+# Numba kernels loaded on first bulk VAX conversion, not at import time;
+# importing numba is slow and most callers never touch VAX data.
+_vax_jit = None
+_vax_jit_checked = False
+
+
+def _jit_vax_kernels():
+    """Return the numba VAX kernel module, or None without numba."""
+    global _vax_jit, _vax_jit_checked
+    if not _vax_jit_checked:
+        _vax_jit_checked = True
+        from geodatarev import _vax_kernels
+        if _vax_kernels.vax_f_array is not None:
+            _vax_jit = _vax_kernels
+    return _vax_jit
 
 
 # ---------------------------------------------------------------------------
@@ -23,15 +51,35 @@ def swap_middle_endian_32(data: bytes) -> bytes:
     """
     if len(data) != 4:
         raise ValueError("Expected exactly 4 bytes")
-    return bytes([data[2], data[3], data[0], data[1]])
+    return data[2:4] + data[0:2]
 
 
 def swap_middle_endian_64(data: bytes) -> bytes:
     """Convert a 64-bit value from PDP-11 middle-endian to little-endian."""
     if len(data) != 8:
         raise ValueError("Expected exactly 8 bytes")
-    return bytes([data[2], data[3], data[0], data[1],
-                  data[6], data[7], data[4], data[5]])
+    return data[2:4] + data[0:2] + data[6:8] + data[4:6]
+
+
+def _reorder_middle(data: bytes) -> bytes:
+    """Middle-endian handler for :func:`reorder_bytes`, dispatched on size."""
+    if len(data) <= 2:
+        # PDP-11 native 16-bit words are little-endian
+        return data
+    if len(data) == 4:
+        return swap_middle_endian_32(data)
+    if len(data) == 8:
+        return swap_middle_endian_64(data)
+    raise ValueError(f"Middle-endian reorder not supported for {len(data)}-byte values")
+
+
+# Handler table so the per-value hot path pays one hash lookup instead of
+# a chain of string compares
+_REORDER = {
+    "little": lambda data: data,
+    "big": lambda data: data[::-1],
+    "middle": _reorder_middle,
+}
 
 
 def reorder_bytes(data: bytes, endian: str) -> bytes:
@@ -56,19 +104,62 @@ def reorder_bytes(data: bytes, endian: str) -> bytes:
     bytes
         Bytes in little-endian order.
     """
-    if endian == "little":
+    try:
+        handler = _REORDER[endian]
+    except KeyError:
+        raise ValueError(f"Unknown endian: {endian!r}") from None
+    return handler(data)
+
+
+def reorder_array(data: bytes, endian: str, elem_size: int) -> bytes:
+    """Re-order every *elem_size*-byte element of *data* to little-endian.
+
+    Array-level counterpart of :func:`reorder_bytes`: a single vectorized
+    pass over the whole buffer instead of one call per element.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw bytes, a contiguous run of *elem_size*-byte elements.
+    endian : str
+        One of ``"little"``, ``"big"``, or ``"middle"``.
+    elem_size : int
+        Size of each element in bytes (1, 2, 4, or 8).
+
+    Returns
+    -------
+    bytes
+        Buffer with every element in little-endian order.
+    """
+    if endian == "little" or elem_size == 1:
         return data
+    if len(data) % elem_size != 0:
+        raise ValueError(
+            f"Data length {len(data)} is not a multiple of element size {elem_size}"
+        )
     if endian == "big":
-        return data[::-1]
+        if np is not None:
+            return np.frombuffer(data, dtype=f"u{elem_size}").byteswap().tobytes()
+        arr = array.array({2: "H", 4: "I", 8: "Q"}[elem_size])
+        arr.frombytes(data)
+        arr.byteswap()
+        return arr.tobytes()
     if endian == "middle":
-        if len(data) <= 2:
+        if elem_size == 2:
             # PDP-11 native 16-bit words are little-endian
             return data
-        if len(data) == 4:
-            return swap_middle_endian_32(data)
-        if len(data) == 8:
-            return swap_middle_endian_64(data)
-        raise ValueError(f"Middle-endian reorder not supported for {len(data)}-byte values")
+        if elem_size == 4:
+            order = (2, 3, 0, 1)
+        elif elem_size == 8:
+            order = (2, 3, 0, 1, 6, 7, 4, 5)
+        else:
+            raise ValueError(
+                f"Middle-endian reorder not supported for {elem_size}-byte values"
+            )
+        out = bytearray(len(data))
+        for dst, src in enumerate(order):
+            out[dst::elem_size] = data[src::elem_size]
+        return bytes(out)
     raise ValueError(f"Unknown endian: {endian!r}")
 
 
@@ -92,7 +183,7 @@ def vax_f_to_ieee(data: bytes) -> float:
 
     # Convert from VAX middle-endian to little-endian
     le = swap_middle_endian_32(data)
-    raw = struct.unpack("<I", le)[0]
+    raw = int.from_bytes(le, "little")
 
     sign = (raw >> 15) & 1
     exponent = (raw >> 7) & 0xFF
@@ -194,7 +285,7 @@ def ibm_float32_to_ieee(data: bytes) -> float:
     if len(data) != 4:
         raise ValueError("Expected exactly 4 bytes")
 
-    raw = struct.unpack(">I", data)[0]
+    raw = int.from_bytes(data, "big")
     sign = (raw >> 31) & 1
     exponent = (raw >> 24) & 0x7F
     fraction = raw & 0x00FFFFFF
@@ -203,7 +294,8 @@ def ibm_float32_to_ieee(data: bytes) -> float:
         return 0.0
 
     # IBM: value = (-1)^sign * (fraction / 2^24) * 16^(exponent - 64)
-    value = (fraction / (1 << 24)) * (16.0 ** (exponent - 64))
+    # Since 16^k == 2^(4k), fold the whole scaling into a single ldexp.
+    value = ldexp(float(fraction), 4 * (exponent - 64) - 24)
     return -value if sign else value
 
 
@@ -216,7 +308,7 @@ def ibm_float64_to_ieee(data: bytes) -> float:
     if len(data) != 8:
         raise ValueError("Expected exactly 8 bytes")
 
-    raw = struct.unpack(">Q", data)[0]
+    raw = int.from_bytes(data, "big")
     sign = (raw >> 63) & 1
     exponent = (raw >> 56) & 0x7F
     fraction = raw & 0x00FFFFFFFFFFFFFF
@@ -224,10 +316,140 @@ def ibm_float64_to_ieee(data: bytes) -> float:
     if fraction == 0:
         return 0.0
 
-    value = (fraction / (1 << 56)) * (16.0 ** (exponent - 64))
+    value = ldexp(float(fraction), 4 * (exponent - 64) - 56)
     return -value if sign else value
 
 
+def vax_f_array(data: bytes) -> "np.ndarray":
+    """Convert a contiguous run of VAX F_floating values to IEEE.
+
+    Vectorized equivalent of :func:`vax_f_to_ieee` — the middle-endian
+    word swap and bitfield reassembly run over the whole buffer at once.
+    Requires numpy.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``float32`` values matching the scalar conversion.
+    """
+    kernels = _jit_vax_kernels()
+    if kernels is not None:
+        return kernels.vax_f_array(data)
+    w = np.frombuffer(data, dtype="<u4").astype(np.uint32)
+    # Middle-endian: swap the two 16-bit halves of each word
+    raw = ((w & np.uint32(0xFFFF)) << np.uint32(16)) | (w >> np.uint32(16))
+
+    sign = (raw >> np.uint32(15)) & np.uint32(1)
+    exponent = (raw >> np.uint32(7)) & np.uint32(0xFF)
+    fraction = ((raw & np.uint32(0x7F)) << np.uint32(16)) | \
+        ((raw >> np.uint32(16)) & np.uint32(0xFFFF))
+
+    ieee_exp = exponent.astype(np.int32) - 2
+    ieee_raw = (sign << np.uint32(31)) | \
+        (ieee_exp.clip(0, 0xFE).astype(np.uint32) << np.uint32(23)) | fraction
+    values = ieee_raw.view(np.float32).copy()
+    # Zero, reserved operand, and underflow all collapse to 0.0
+    values[(exponent == 0) | (ieee_exp <= 0)] = 0.0
+    return values
+
+
+def vax_d_array(data: bytes) -> "np.ndarray":
+    """Convert a contiguous run of VAX D_floating values to IEEE doubles.
+
+    Vectorized equivalent of :func:`vax_d_to_ieee`.  Requires numpy.
+    """
+    kernels = _jit_vax_kernels()
+    if kernels is not None:
+        return kernels.vax_d_array(data)
+    w = np.frombuffer(data, dtype="<u8").astype(np.uint64)
+    # Middle-endian: swap adjacent 16-bit words within each 64-bit value
+    lane_mask = np.uint64(0x0000FFFF0000FFFF)
+    raw = ((w & lane_mask) << np.uint64(16)) | ((w >> np.uint64(16)) & lane_mask)
+
+    sign = (raw >> np.uint64(15)) & np.uint64(1)
+    exponent = (raw >> np.uint64(7)) & np.uint64(0xFF)
+    frac_hi = raw & np.uint64(0x7F)
+    frac_lo = (raw >> np.uint64(16)) & np.uint64(0xFFFFFFFFFFFF)
+    fraction = (frac_hi << np.uint64(48)) | frac_lo
+
+    # VAX bias 128 -> IEEE bias 1023, minus 1 for normalisation; truncate
+    # the 55-bit fraction to IEEE's 52 bits
+    ieee_exp = exponent.astype(np.int64) + (1023 - 128 - 1)
+    ieee_raw = (sign << np.uint64(63)) | \
+        (ieee_exp.clip(0, 0x7FE).astype(np.uint64) << np.uint64(52)) | \
+        (fraction >> np.uint64(3))
+    values = ieee_raw.view(np.float64).copy()
+    values[(exponent == 0) | (ieee_exp <= 0)] = 0.0
+    return values
+
+
+def vax_g_array(data: bytes) -> "np.ndarray":
+    """Convert a contiguous run of VAX G_floating values to IEEE doubles.
+
+    Vectorized equivalent of :func:`vax_g_to_ieee`.  Requires numpy.
+    """
+    kernels = _jit_vax_kernels()
+    if kernels is not None:
+        return kernels.vax_g_array(data)
+    w = np.frombuffer(data, dtype="<u8").astype(np.uint64)
+    lane_mask = np.uint64(0x0000FFFF0000FFFF)
+    raw = ((w & lane_mask) << np.uint64(16)) | ((w >> np.uint64(16)) & lane_mask)
+
+    sign = (raw >> np.uint64(15)) & np.uint64(1)
+    exponent = (raw >> np.uint64(4)) & np.uint64(0x7FF)
+    frac_hi = raw & np.uint64(0xF)
+    frac_lo = (raw >> np.uint64(16)) & np.uint64(0xFFFFFFFFFFFF)
+    fraction = (frac_hi << np.uint64(48)) | frac_lo
+
+    ieee_exp = exponent.astype(np.int64) - 2
+    ieee_raw = (sign << np.uint64(63)) | \
+        (ieee_exp.clip(0, 0x7FE).astype(np.uint64) << np.uint64(52)) | fraction
+    values = ieee_raw.view(np.float64).copy()
+    values[(exponent == 0) | (ieee_exp <= 0)] = 0.0
+    return values
+
+
+def ibm_float32_array(data: bytes) -> "np.ndarray":
+    """Convert a contiguous run of 4-byte IBM hexadecimal floats to IEEE.
+
+    Vectorized equivalent of :func:`ibm_float32_to_ieee` — bitfield
+    extraction and a single ``ldexp`` over the whole buffer instead of a
+    per-element Python loop.  Requires numpy.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``float64`` values, bit-identical to the scalar conversion.
+    """
+    raw = np.frombuffer(data, dtype=">u4").astype(np.uint32)
+    sign = (raw >> np.uint32(31)) & np.uint32(1)
+    exponent = (raw >> np.uint32(24)) & np.uint32(0x7F)
+    fraction = raw & np.uint32(0x00FFFFFF)
+
+    # value = fraction * 16^(exponent-64) / 2^24
+    #       = ldexp(fraction, 4*(exponent-64) - 24)
+    shift = 4 * (exponent.astype(np.int32) - 64) - 24
+    values = np.ldexp(fraction.astype(np.float64), shift)
+    values[fraction == 0] = 0.0
+    return np.where(sign.astype(bool), -values, values)
+
+
+def ibm_float64_array(data: bytes) -> "np.ndarray":
+    """Convert a contiguous run of 8-byte IBM hexadecimal floats to IEEE.
+
+    Vectorized equivalent of :func:`ibm_float64_to_ieee`.  Requires numpy.
+    """
+    raw = np.frombuffer(data, dtype=">u8").astype(np.uint64)
+    sign = (raw >> np.uint64(63)) & np.uint64(1)
+    exponent = (raw >> np.uint64(56)) & np.uint64(0x7F)
+    fraction = raw & np.uint64(0x00FFFFFFFFFFFFFF)
+
+    shift = 4 * (exponent.astype(np.int64) - 64) - 56
+    values = np.ldexp(fraction.astype(np.float64), shift)
+    values[fraction == 0] = 0.0
+    return np.where(sign.astype(bool), -values, values)
+
+
 # ---------------------------------------------------------------------------
 # Generic decode helper
 # ---------------------------------------------------------------------------
@@ -245,12 +467,42 @@ _DTYPE_STRUCT = {
     "float64": ("d", 8),
 }
 
+# Legacy float dtypes grouped by element size; frozenset membership is a
+# hash probe vs the linear scan of a tuple literal
+_LEGACY_4B = frozenset({"vax_f", "ibm_float32"})
+_LEGACY_8B = frozenset({"vax_d", "vax_g", "ibm_float64"})
+_LEGACY_DTYPES = _LEGACY_4B | _LEGACY_8B
+
 # Mapping from our endian names to struct format prefixes
 _ENDIAN_PREFIX = {
     "little": "<",
     "big": ">",
 }
 
+# Mapping from our dtype names to numpy dtype codes
+_NP_DTYPE = {
+    "uint8": "u1", "int8": "i1",
+    "uint16": "u2", "int16": "i2",
+    "uint32": "u4", "int32": "i4",
+    "uint64": "u8", "int64": "i8",
+    "float32": "f4", "float64": "f8",
+}
+
+# Precompiled scalar Structs keyed on (dtype, endian), so the per-value
+# hot path skips struct's format-string parse/cache lookup
+_SCALAR_STRUCTS: dict[tuple[str, str], struct.Struct] = {
+    (dtype, endian): struct.Struct(prefix + fmt_char)
+    for dtype, (fmt_char, _size) in _DTYPE_STRUCT.items()
+    for endian, prefix in _ENDIAN_PREFIX.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _array_struct(dtype: str, endian: str, n: int) -> struct.Struct:
+    """Precompiled bulk Struct for *n* elements of *dtype*."""
+    prefix = _ENDIAN_PREFIX.get(endian, "<")
+    return struct.Struct(f"{prefix}{n}{_DTYPE_STRUCT[dtype][0]}")
+
 
 def decode_value(data: bytes, dtype: str, endian: str = "little") -> int | float:
     """Decode a single scalar value from bytes.
@@ -292,11 +544,84 @@ def decode_value(data: bytes, dtype: str, endian: str = "little") -> int | float
         data = reorder_bytes(data, "middle")
         endian = "little"
 
-    prefix = _ENDIAN_PREFIX.get(endian, "<")
-    return struct.unpack(f"{prefix}{fmt_char}", data)[0]
+    s = _SCALAR_STRUCTS.get((dtype, endian)) or _SCALAR_STRUCTS[(dtype, "little")]
+    return s.unpack(data)[0]
 
 
-def decode_array(data: bytes, dtype: str, endian: str = "little") -> list[int | float]:
+def _elem_size(dtype: str) -> int:
+    """Element size in bytes for *dtype*, raising on unknown names."""
+    if dtype in _LEGACY_4B:
+        return 4
+    if dtype in _LEGACY_8B:
+        return 8
+    info = _DTYPE_STRUCT.get(dtype)
+    if info is None:
+        raise ValueError(f"Unsupported dtype: {dtype!r}")
+    return info[1]
+
+
+def decode_array_np(data: bytes, dtype: str, endian: str = "little") -> "np.ndarray":
+    """Decode a contiguous array of values to a numpy ndarray.
+
+    For standard IEEE types this is zero-copy: the returned array is a
+    view over *data* (read-only).  Legacy formats (VAX, IBM) go through
+    the vectorized conversion kernels and return a fresh array.
+    Requires numpy.
+
+    Parameters
+    ----------
+    data : bytes
+        Raw bytes.
+    dtype : str
+        Data type name.
+    endian : str
+        Byte order.
+
+    Returns
+    -------
+    numpy.ndarray
+        Decoded values.
+    """
+    if np is None:
+        raise ImportError("decode_array_np requires numpy (install the 'fast' extra)")
+
+    elem_size = _elem_size(dtype)
+    if len(data) % elem_size != 0:
+        raise ValueError(
+            f"Data length {len(data)} is not a multiple of element size {elem_size}"
+        )
+
+    if dtype == "ibm_float32":
+        return ibm_float32_array(data)
+    if dtype == "ibm_float64":
+        return ibm_float64_array(data)
+    if dtype == "vax_f":
+        return vax_f_array(data)
+    if dtype == "vax_d":
+        return vax_d_array(data)
+    if dtype == "vax_g":
+        return vax_g_array(data)
+
+    if endian == "middle":
+        # Swap the 16-bit halves of each word once, over the whole buffer
+        if elem_size <= 2:
+            return np.frombuffer(data, dtype=f"<{_NP_DTYPE[dtype]}")
+        w = np.frombuffer(data, dtype=f"<u{elem_size}")
+        if elem_size == 4:
+            swapped = ((w & np.uint32(0xFFFF)) << np.uint32(16)) | (w >> np.uint32(16))
+        else:
+            lane_mask = np.uint64(0x0000FFFF0000FFFF)
+            swapped = ((w & lane_mask) << np.uint64(16)) | \
+                ((w >> np.uint64(16)) & lane_mask)
+        return swapped.view(np.dtype(f"<{_NP_DTYPE[dtype]}"))
+
+    np_endian = ">" if endian == "big" else "<"
+    return np.frombuffer(data, dtype=f"{np_endian}{_NP_DTYPE[dtype]}")
+
+
+def decode_array(
+    data: bytes, dtype: str, endian: str = "little", as_numpy: bool = False
+) -> "list[int | float] | np.ndarray":
     """Decode a contiguous array of values from bytes.
 
     For standard IEEE types uses numpy (if available) or struct bulk
@@ -311,23 +636,20 @@ def decode_array(data: bytes, dtype: str, endian: str = "little") -> list[int |
         Data type name.
     endian : str
         Byte order.
+    as_numpy : bool
+        When True (and numpy is installed), return an ``np.ndarray``
+        instead of a list.  For IEEE types the array is a zero-copy view
+        over *data*, avoiding N boxed Python objects on large payloads.
 
     Returns
     -------
-    list
+    list or numpy.ndarray
         Decoded values.
     """
-    # Determine element size
-    if dtype in ("vax_f", "ibm_float32"):
-        elem_size = 4
-    elif dtype in ("vax_d", "vax_g", "ibm_float64"):
-        elem_size = 8
-    else:
-        info = _DTYPE_STRUCT.get(dtype)
-        if info is None:
-            raise ValueError(f"Unsupported dtype: {dtype!r}")
-        elem_size = info[1]
+    if as_numpy and np is not None:
+        return decode_array_np(data, dtype, endian)
 
+    elem_size = _elem_size(dtype)
     if len(data) % elem_size != 0:
         raise ValueError(
             f"Data length {len(data)} is not a multiple of element size {elem_size}"
@@ -335,29 +657,32 @@ def decode_array(data: bytes, dtype: str, endian: str = "little") -> list[int |
 
     n = len(data) // elem_size
 
+    # Middle-endian IEEE payloads: swap the whole buffer once, then
+    # decode as little-endian rather than reordering per element
+    if endian == "middle" and dtype in _DTYPE_STRUCT:
+        data = reorder_array(data, "middle", elem_size)
+        endian = "little"
+
     # Fast path: standard IEEE types via numpy or struct bulk unpack
-    if dtype not in ("vax_f", "vax_d", "vax_g", "ibm_float32", "ibm_float64") and endian != "middle":
-        info = _DTYPE_STRUCT[dtype]
-        prefix = _ENDIAN_PREFIX.get(endian, "<")
+    if dtype not in _LEGACY_DTYPES and endian != "middle":
         # Try numpy first for large arrays
-        if n > 256:
-            try:
-                import numpy as np
-                np_endian = "<" if endian == "little" else ">"
-                np_dtype_map = {
-                    "uint8": "u1", "int8": "i1",
-                    "uint16": "u2", "int16": "i2",
-                    "uint32": "u4", "int32": "i4",
-                    "uint64": "u8", "int64": "i8",
-                    "float32": "f4", "float64": "f8",
-                }
-                np_dt = np.dtype(f"{np_endian}{np_dtype_map[dtype]}")
-                return np.frombuffer(data, dtype=np_dt).tolist()
-            except ImportError:
-                pass
-        # Fallback: struct bulk unpack
-        fmt_char = info[0]
-        return list(struct.unpack(f"{prefix}{n}{fmt_char}", data))
+        if n > 256 and np is not None:
+            return decode_array_np(data, dtype, endian).tolist()
+        # Fallback: struct bulk unpack (cached, precompiled Struct)
+        return list(_array_struct(dtype, endian, n).unpack(data))
+
+    # Vectorized path for large legacy-float arrays
+    if np is not None and n > _VECTOR_MIN_N:
+        if dtype == "ibm_float32":
+            return ibm_float32_array(data).tolist()
+        if dtype == "ibm_float64":
+            return ibm_float64_array(data).tolist()
+        if dtype == "vax_f":
+            return vax_f_array(data).tolist()
+        if dtype == "vax_d":
+            return vax_d_array(data).tolist()
+        if dtype == "vax_g":
+            return vax_g_array(data).tolist()
 
     # Slow path: per-element decode for legacy formats
     return [decode_value(data[i * elem_size:(i + 1) * elem_size], dtype, endian) for i in range(n)]
@@ -8,10 +8,11 @@ drivers.
 
 from __future__ import annotations
 
+import functools
 import importlib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
 # ---------------------------------------------------------------------------
@@ -112,21 +113,80 @@ DEPRECATED_FORMAT_GDAL_VERSIONS: dict[str, DeprecatedDriverInfo] = {
     ),
 }
 
+#: Serialized form of the table above, built once at import; the registry
+#: is static so there is no point rebuilding it per strategy call.
+_DEPRECATED_FORMATS_SERIALIZED: dict[str, dict[str, Any]] = {
+    k: {
+        "driver": v.driver_name,
+        "description": v.description,
+        "last_supported": v.last_supported_version,
+        "removal_version": v.removal_version,
+        "alternatives": v.alternatives,
+        "notes": v.notes,
+    }
+    for k, v in DEPRECATED_FORMAT_GDAL_VERSIONS.items()
+}
+
 
 # ---------------------------------------------------------------------------
 # GDAL availability check
 # ---------------------------------------------------------------------------
 
+#: Cached osgeo.gdal module; the import is paid once per process.
+_osgeo_gdal = None
+#: Remembered import failure, so the cold "no GDAL" path skips the
+#: module-finder search on every subsequent call.
+_osgeo_gdal_error: str | None = None
+
+
+def _gdal_module():
+    """Import ``osgeo.gdal`` on first use and cache the outcome.
+
+    Both outcomes are remembered: a successful import returns the cached
+    module, a failed one re-raises ``ImportError`` without repeating the
+    (slow) finder search for a package that is not installed.
+    """
+    global _osgeo_gdal, _osgeo_gdal_error
+    if _osgeo_gdal is None:
+        if _osgeo_gdal_error is not None:
+            raise ImportError(_osgeo_gdal_error)
+        try:
+            _osgeo_gdal = importlib.import_module("osgeo.gdal")
+        except ImportError as exc:
+            _osgeo_gdal_error = str(exc)
+            raise
+    return _osgeo_gdal
+
+
+def _reset_gdal_cache() -> None:
+    """Forget every memoized GDAL probe result.
+
+    Clears the cached module, the remembered import failure and the
+    :func:`check_gdal_available` cache in one go; tests that patch
+    ``sys.modules`` need all three reset or a cached answer defeats the
+    patch (or the mocked failure leaks into later callers).
+    """
+    global _osgeo_gdal, _osgeo_gdal_error
+    _osgeo_gdal = None
+    _osgeo_gdal_error = None
+    check_gdal_available.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def check_gdal_available() -> dict[str, Any]:
     """Check whether the GDAL Python bindings (``osgeo``) are installed.
 
+    The answer cannot change within a process, so the result is cached;
+    call ``check_gdal_available.cache_clear()`` to force a re-probe
+    (tests that patch ``sys.modules`` need this).
+
     Returns
     -------
     dict
         ``{"available": bool, "version": str | None, "error": str | None}``
     """
     try:
-        osgeo_gdal = importlib.import_module("osgeo.gdal")
+        osgeo_gdal = _gdal_module()
         version = getattr(osgeo_gdal, "__version__", None)
         if version is None:
             version = getattr(osgeo_gdal, "VersionInfo", lambda _: "unknown")("RELEASE_NAME")
@@ -155,38 +215,33 @@ class GDALCheckResult:
     error: str = ""
 
 
-def try_gdal_open(path: str | Path) -> GDALCheckResult:
-    """Attempt to open a file with GDAL and return driver/metadata info.
-
-    This is the primary "can GDAL read it?" function.  If GDAL is not
-    installed the result's ``error`` field explains the situation.
-
-    Parameters
-    ----------
-    path : str or Path
-        Path to the file to test.
+def _probe_file(osgeo_gdal, path: Path) -> GDALCheckResult:
+    """Open one file with GDAL and fill in a :class:`GDALCheckResult`.
 
-    Returns
-    -------
-    GDALCheckResult
+    Assumes the caller has already installed the quiet error handler and
+    probe config options.
     """
     result = GDALCheckResult()
-    path = Path(path)
 
     if not path.is_file():
         result.error = f"File not found: {path}"
         return result
 
     try:
-        osgeo_gdal = importlib.import_module("osgeo.gdal")
-    except ImportError:
-        result.error = "GDAL Python bindings (osgeo) are not installed"
-        return result
-
-    # Suppress GDAL error messages during probing
-    osgeo_gdal.PushErrorHandler("CPLQuietErrorHandler")
-    try:
-        ds = osgeo_gdal.Open(str(path))
+        # When the extension maps to known drivers, OpenEx with an
+        # allow-list skips the Identify probe of every registered driver
+        drivers = EXTENSION_DRIVER_MAP.get(path.suffix.lower())
+        if drivers and hasattr(osgeo_gdal, "OpenEx"):
+            ds = osgeo_gdal.OpenEx(
+                str(path),
+                osgeo_gdal.OF_RASTER | osgeo_gdal.OF_READONLY,
+                allowed_drivers=drivers,
+            )
+            # The allow-list may simply be wrong for this file; retry open
+            if ds is None:
+                ds = osgeo_gdal.Open(str(path))
+        else:
+            ds = osgeo_gdal.Open(str(path))
         if ds is None:
             result.error = "GDAL could not open the file"
             return result
@@ -219,22 +274,102 @@ def try_gdal_open(path: str | Path) -> GDALCheckResult:
         ds = None  # close
     except Exception as exc:
         result.error = str(exc)
+
+    return result
+
+
+def try_gdal_open(path: str | Path) -> GDALCheckResult:
+    """Attempt to open a file with GDAL and return driver/metadata info.
+
+    This is the primary "can GDAL read it?" function.  If GDAL is not
+    installed the result's ``error`` field explains the situation.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the file to test.
+
+    Returns
+    -------
+    GDALCheckResult
+    """
+    path = Path(path)
+    if not path.is_file():
+        result = GDALCheckResult()
+        result.error = f"File not found: {path}"
+        return result
+
+    try:
+        osgeo_gdal = _gdal_module()
+    except ImportError:
+        result = GDALCheckResult()
+        result.error = "GDAL Python bindings (osgeo) are not installed"
+        return result
+
+    # Suppress GDAL error messages during probing, and skip the sidecar
+    # directory scan Open() would otherwise perform — expensive in
+    # populated directories or on network shares
+    osgeo_gdal.PushErrorHandler("CPLQuietErrorHandler")
+    prev_readdir = osgeo_gdal.GetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN")
+    osgeo_gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+    try:
+        return _probe_file(osgeo_gdal, path)
     finally:
+        osgeo_gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", prev_readdir)
         osgeo_gdal.PopErrorHandler()
 
-    return result
+
+def try_gdal_open_many(paths: Iterable[str | Path]) -> Iterator[GDALCheckResult]:
+    """Probe many files with GDAL, amortizing the per-call setup.
+
+    The error handler push/pop and config-option juggling of
+    :func:`try_gdal_open` happen once for the whole batch instead of per
+    file, which matters when sweeping directories of thousands of small
+    files.
+
+    Parameters
+    ----------
+    paths : iterable of str or Path
+        Files to probe.
+
+    Yields
+    ------
+    GDALCheckResult
+        One result per path, in input order.
+    """
+    try:
+        osgeo_gdal = _gdal_module()
+    except ImportError:
+        for _ in paths:
+            result = GDALCheckResult()
+            result.error = "GDAL Python bindings (osgeo) are not installed"
+            yield result
+        return
+
+    osgeo_gdal.PushErrorHandler("CPLQuietErrorHandler")
+    prev_readdir = osgeo_gdal.GetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN")
+    osgeo_gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+    try:
+        for path in paths:
+            yield _probe_file(osgeo_gdal, Path(path))
+    finally:
+        osgeo_gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", prev_readdir)
+        osgeo_gdal.PopErrorHandler()
 
 
 # ---------------------------------------------------------------------------
 # Old GDAL build strategy
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def get_old_gdal_strategy() -> dict[str, Any]:
     """Return a strategy guide for obtaining old GDAL builds.
 
     Legacy geophysics files sometimes rely on format drivers that have
     been deprecated or removed from modern GDAL releases.  This function
     documents practical approaches for accessing those older drivers.
+    The guide is static, so callers share one cached dict — treat it as
+    read-only.
 
     Returns
     -------
@@ -312,16 +447,6 @@ def get_old_gdal_strategy() -> dict[str, Any]:
 
     return {
         "approaches": approaches,
-        "deprecated_formats": {
-            k: {
-                "driver": v.driver_name,
-                "description": v.description,
-                "last_supported": v.last_supported_version,
-                "removal_version": v.removal_version,
-                "alternatives": v.alternatives,
-                "notes": v.notes,
-            }
-            for k, v in DEPRECATED_FORMAT_GDAL_VERSIONS.items()
-        },
+        "deprecated_formats": _DEPRECATED_FORMATS_SERIALIZED,
         "notes": notes,
     }
@@ -26,6 +26,32 @@ class FileIdentifier:
     def __init__(self, configs: list[FormatConfig] | None = None):
         self.configs: list[FormatConfig] = configs if configs is not None else load_config()
         self._max_read = self._compute_max_read()
+        self._probe_plan = self._build_probe_plan()
+        # Extension lookup index, built once; lists keep declaration order
+        self._ext_index: dict[str, list[FormatConfig]] = {}
+        for cfg in self.configs:
+            for ext in cfg.extensions:
+                self._ext_index.setdefault(ext.lower(), []).append(cfg)
+
+    def _build_probe_plan(
+        self,
+    ) -> list[tuple[int, tuple[int, ...], dict[bytes, list[FormatConfig]]]]:
+        """Bucket configs by magic offset for O(1) hash dispatch.
+
+        Each entry is ``(offset, distinct magic lengths, {magic: configs})``
+        so identification probes one dict per (offset, length) pair instead
+        of slicing and comparing against every config.
+        """
+        by_offset: dict[int, dict[bytes, list[FormatConfig]]] = {}
+        for cfg in self.configs:
+            if not cfg.magic_bytes:
+                continue
+            table = by_offset.setdefault(cfg.magic_offset, {})
+            table.setdefault(cfg.magic_bytes, []).append(cfg)
+        return [
+            (off, tuple(sorted({len(m) for m in table})), table)
+            for off, table in sorted(by_offset.items())
+        ]
 
     def _compute_max_read(self) -> int:
         """Determine how many bytes we need to read for identification."""
@@ -51,13 +77,11 @@ class FileIdentifier:
             (longest magic bytes first).
         """
         matches: list[FormatConfig] = []
-        for cfg in self.configs:
-            if not cfg.magic_bytes:
-                continue
-            start = cfg.magic_offset
-            end = start + len(cfg.magic_bytes)
-            if end <= len(data) and data[start:end] == cfg.magic_bytes:
-                matches.append(cfg)
+        for offset, lengths, table in self._probe_plan:
+            for length in lengths:
+                hit = table.get(data[offset:offset + length])
+                if hit:
+                    matches.extend(hit)
         matches.sort(key=lambda c: len(c.magic_bytes), reverse=True)
         return matches
 
@@ -74,10 +98,19 @@ class FileIdentifier:
         list[FormatConfig]
             Matching format configs.
         """
-        path = Path(path)
-        read_size = max(self._max_read, 512)
-        with open(path, "rb") as fh:
-            data = fh.read(read_size)
+        # Round the read up to one page so it aligns with the kernel's
+        # readahead unit; bulk scans are bounded by syscalls, not bytes.
+        read_size = (max(self._max_read, 512) + 4095) & ~4095
+        if hasattr(os, "pread"):
+            # Raw fd read skips the buffered file-object wrapper
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                data = os.pread(fd, read_size, 0)
+            finally:
+                os.close(fd)
+        else:  # pragma: no cover - Windows has no pread
+            with open(path, "rb") as fh:
+                data = fh.read(read_size)
         return self.identify_bytes(data)
 
     def identify_by_extension(self, path: str | Path) -> list[FormatConfig]:
@@ -94,4 +127,26 @@ class FileIdentifier:
             Configs with a matching extension.
         """
         ext = Path(path).suffix.lower()
-        return [cfg for cfg in self.configs if ext in cfg.extensions]
+        return self._ext_index.get(ext, [])
+
+
+#: Shared identifier over the built-in config, built on first use so
+#: callers in tight loops do not re-parse the YAML registry per call.
+_DEFAULT_IDENTIFIER: FileIdentifier | None = None
+
+
+def get_default_identifier() -> FileIdentifier:
+    """Return the lazily built identifier for the default format registry."""
+    global _DEFAULT_IDENTIFIER
+    if _DEFAULT_IDENTIFIER is None:
+        _DEFAULT_IDENTIFIER = FileIdentifier()
+    return _DEFAULT_IDENTIFIER
+
+
+def identify_file(path: str | Path) -> list[FormatConfig]:
+    """Identify *path* using the shared default identifier.
+
+    Convenience wrapper around :meth:`FileIdentifier.identify_file` for
+    callers that do not need a custom config list.
+    """
+    return get_default_identifier().identify_file(path)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import importlib
+import mmap
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -9,6 +11,22 @@ from typing import Any
 from geodatarev.config import FormatConfig
 from geodatarev.float_formats import decode_value
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
+#: Parser classes resolved lazily via PEP 562 so importing the package
+#: does not pull in every format module (and their optional numpy use).
+_LAZY_EXPORTS = {
+    "Surfer6Parser": "geodatarev.parsers.surfer6",
+    "Surfer7Parser": "geodatarev.parsers.surfer7",
+    "ERMapperParser": "geodatarev.parsers.ermapper",
+    "EncomParser": "geodatarev.parsers.encom",
+    "GeosoftParser": "geodatarev.parsers.geosoft",
+    "ZMapParser": "geodatarev.parsers.zmap",
+}
+
 
 @dataclass
 class ParseResult:
@@ -16,11 +34,25 @@ class ParseResult:
 
     format_name: str = ""
     header: dict[str, Any] = field(default_factory=dict)
-    data: list = field(default_factory=list)
+    #: Flat data payload: a list, or a numpy ndarray when the parser
+    #: decodes vectorized.  ``shape`` carries the grid dimensions.
+    data: Any = field(default_factory=list)
     shape: tuple[int, ...] = ()
     metadata: dict[str, Any] = field(default_factory=dict)
     errors: list[str] = field(default_factory=list)
 
+    def to_float32(self) -> "ParseResult":
+        """Downcast ndarray data to float32 in place, halving its memory.
+
+        Useful for summary-only pipelines where float64 precision is
+        wasted bandwidth.  A no-op when ``data`` is a plain list or
+        already single precision; returns ``self`` for chaining.
+        """
+        if (np is not None and isinstance(self.data, np.ndarray)
+                and self.data.dtype != np.float32):
+            self.data = self.data.astype(np.float32)
+        return self
+
 
 class BaseParser:
     """Base class for format-specific parsers.
@@ -29,6 +61,10 @@ class BaseParser:
     """
 
     name: str = "base"
+    #: Leading magic bytes for O(1) dispatch by the scanner; parsers
+    #: identified by content sniffing rather than a fixed prefix leave
+    #: this as None and are probed via :meth:`can_parse`.
+    magic: bytes | None = None
 
     def can_parse(self, data: bytes, config: FormatConfig | None = None) -> bool:
         """Return True if this parser can handle the given data."""
@@ -39,10 +75,34 @@ class BaseParser:
         raise NotImplementedError
 
     def parse_file(self, path: str | Path, config: FormatConfig | None = None) -> ParseResult:
-        """Parse a file from disk."""
-        with open(Path(path), "rb") as fh:
-            data = fh.read()
-        return self.parse(data, config)
+        """Parse a file from disk.
+
+        The file is memory-mapped rather than read wholesale, so the OS
+        pages data in on demand and large payloads are not duplicated in
+        a Python bytes object before parsing.  Empty files (which cannot
+        be mapped) fall back to a plain read.
+        """
+        path = Path(path)
+        with open(path, "rb") as fh:
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                result = self.parse(fh.read(), config)
+            else:
+                with mm:
+                    result = self.parse(mm, config)
+        self.finalize_from_path(result, path, config)
+        return result
+
+    def finalize_from_path(self, result: ParseResult, path: Path,
+                           config: FormatConfig | None = None) -> None:
+        """Attach path-derived extras to an already-parsed *result*.
+
+        A no-op by default.  Formats that span companion files (such as
+        the decoupled ER Mapper header/binary pair) override this so
+        callers that parse from a shared buffer — the scanner, notably —
+        still discover the extra files when a real path is known.
+        """
 
     # ------------------------------------------------------------------
     # Helper utilities for subclasses
@@ -58,3 +118,14 @@ class BaseParser:
         if dtype == "bytes":
             return chunk
         return decode_value(chunk, dtype, endian)
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is not None:
+        return getattr(importlib.import_module(module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,53 @@
+"""Optional numba-compiled kernels for the Geosoft parser.
+
+When numba is installed (the ``jit`` extra), the dummy-masking and
+scaling pass over a decoded payload runs as a parallel compiled loop
+instead of NumPy ufunc calls, avoiding the intermediate mask array and
+splitting the work across cores.  Importing this module never raises:
+without numba, :data:`scale_payload` is ``None`` and the parser keeps
+its NumPy path.
+"""
+
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _scale_float(raw, dummy, zmult, zbase, out):  # pragma: no cover - needs numba
+        nulls = 0
+        for i in numba.prange(raw.shape[0]):
+            v = raw[i]
+            if v <= dummy:
+                out[i] = np.nan
+                nulls += 1
+            else:
+                out[i] = v / zmult + zbase
+        return nulls
+
+    @numba.njit(cache=True, parallel=True)
+    def _scale_int(raw, dummy, zmult, zbase, out):  # pragma: no cover - needs numba
+        nulls = 0
+        for i in numba.prange(raw.shape[0]):
+            v = raw[i]
+            if v == dummy:
+                out[i] = np.nan
+                nulls += 1
+            else:
+                out[i] = v / zmult + zbase
+        return nulls
+
+    def scale_payload(raw, is_float, dummy, zmult, zbase):  # pragma: no cover - needs numba
+        """Scale *raw* to float64 with dummies as NaN; returns (out, null_count)."""
+        out = np.empty(raw.shape[0], dtype=np.float64)
+        kernel = _scale_float if is_float else _scale_int
+        nulls = kernel(raw, float(dummy) if is_float else dummy, zmult, zbase, out)
+        return out, int(nulls)
+
+else:
+    scale_payload = None
@@ -0,0 +1,34 @@
+"""Optional numba-compiled kernels for the ZMap parser.
+
+With numba installed (the ``jit`` extra), null classification fuses the
+abs-compare, NaN fill and null count into one native pass over the
+parsed values instead of three numpy traversals.  Importing this module
+never raises: without numba, :data:`classify_nulls` is ``None`` and the
+parser keeps its numpy path.
+"""
+
+from __future__ import annotations
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _classify(arr, null_floor):  # pragma: no cover - needs numba
+        nulls = 0
+        for i in numba.prange(arr.shape[0]):
+            if abs(arr[i]) >= null_floor:
+                arr[i] = np.nan
+                nulls += 1
+        return nulls
+
+    def classify_nulls(arr, null_floor):  # pragma: no cover - needs numba
+        """NaN-out values at or above *null_floor* in place; return the count."""
+        return int(_classify(arr, null_floor))
+
+else:
+    classify_nulls = None
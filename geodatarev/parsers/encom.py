@@ -7,16 +7,33 @@ is contiguous 32-bit IEEE 754 floats immediately after the header.
 
 from __future__ import annotations
 
+import functools
 import struct
 from pathlib import Path
 
 from geodatarev.config import FormatConfig
 from geodatarev.parsers import BaseParser, ParseResult
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
 HEADER_SIZE = 240
 GRID_MARKER = b"GRID"
 GRID_MARKER_OFFSET = 168
 
+# Dimensions (i32 at 4 and 8) and extents (six f64 from 12) are
+# contiguous, so the whole numeric header unpacks in one C call
+_HDR_FIELDS = struct.Struct("<2i6d")
+_HDR_OFFSET = 4
+
+
+@functools.lru_cache(maxsize=32)
+def _f32_struct(n_values: int) -> struct.Struct:
+    """Compiled struct for an *n_values*-float payload."""
+    return struct.Struct(f"<{n_values}f")
+
 
 class EncomParser(BaseParser):
     name = "encom"
@@ -32,27 +49,14 @@ class EncomParser(BaseParser):
             result.errors.append("Not a valid Encom ModelVision grid")
             return result
 
-        # Parse known header fields (ASCII-padded, positions from Tensor docs)
-        def _ascii(start: int, length: int) -> str:
-            return data[start:start + length].decode("ascii", errors="replace").strip("\x00 ")
-
-        def _f64(offset: int) -> float:
-            return struct.unpack_from("<d", data, offset)[0]
-
-        def _i32(offset: int) -> int:
-            return struct.unpack_from("<i", data, offset)[0]
-
+        # Parse known header fields (positions from Tensor docs); the
+        # dimensions start at offset 4 with no gaps between fields
         header: dict = {}
-        # Dimensions typically at offsets 4-8
         try:
-            header["nx"] = _i32(4)
-            header["ny"] = _i32(8)
-            header["xmin"] = _f64(12)
-            header["xmax"] = _f64(20)
-            header["ymin"] = _f64(28)
-            header["ymax"] = _f64(36)
-            header["zmin"] = _f64(44)
-            header["zmax"] = _f64(52)
+            (header["nx"], header["ny"],
+             header["xmin"], header["xmax"],
+             header["ymin"], header["ymax"],
+             header["zmin"], header["zmax"]) = _HDR_FIELDS.unpack_from(data, _HDR_OFFSET)
         except struct.error:
             result.errors.append("Could not parse header dimensions")
             return result
@@ -72,6 +76,10 @@ class EncomParser(BaseParser):
 
         n_values = min(len(payload) // 4, nx * ny) if nx > 0 and ny > 0 else len(payload) // 4
         if n_values > 0:
-            result.data = list(struct.unpack_from(f"<{n_values}f", payload))
+            if np is not None:
+                # Zero-copy view over the payload: no boxed floats, no list
+                result.data = np.frombuffer(payload, dtype="<f4", count=n_values)
+            else:
+                result.data = list(_f32_struct(n_values).unpack_from(payload))
 
         return result
@@ -20,46 +20,50 @@ from geodatarev.parsers import BaseParser, ParseResult
 
 ERS_MAGIC = b"DatasetHeader"
 
+# Single token pattern covering all three line shapes (block open, block
+# close, key = value).  One finditer pass over the whole header replaces
+# the splitlines + strip + per-line match loop; comment and blank lines
+# simply never match.
+_ERS_TOKEN = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<begin>\w+)[ \t]+Begin"
+    r"|(?:\w+[ \t]+)?(?P<end>End)"
+    r'|(?P<key>\w+)[ \t]*=[ \t]*"?(?P<val>[^"\n]*)"?'
+    r")[ \t]*\r?$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Numeric value shape; classifying up front keeps the int/float coercion
+# off the exception path (raising ValueError per non-numeric value is the
+# slow road in CPython, and headers are mostly strings).  Must accept
+# everything float()/int() do, including ``.5``, ``5.`` and ``+3``.
+_ERS_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
 
 def _parse_ers_header(text: str) -> dict[str, Any]:
     """Parse an ER Mapper ``.ers`` text header into a nested dict."""
     result: dict[str, Any] = {}
     stack: list[dict[str, Any]] = [result]
 
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("//"):
-            continue
-
-        # Opening a block: ``BlockName  Begin``
-        m = re.match(r"^(\w+)\s+Begin\s*$", stripped, re.IGNORECASE)
-        if m:
-            key = m.group(1)
+    for m in _ERS_TOKEN.finditer(text):
+        block = m.group("begin")
+        if block is not None:
+            # Opening a block: ``BlockName  Begin``
             child: dict[str, Any] = {}
-            stack[-1][key] = child
+            stack[-1][block] = child
             stack.append(child)
-            continue
-
-        # Closing a block: ``End`` or ``BlockName End``
-        if re.match(r"^(\w+\s+)?End\s*$", stripped, re.IGNORECASE):
+        elif m.group("end") is not None:
+            # Closing a block: ``End`` or ``BlockName End``
             if len(stack) > 1:
                 stack.pop()
-            continue
-
-        # Key = value
-        m = re.match(r'^(\w+)\s*=\s*"?([^"]*)"?\s*$', stripped)
-        if m:
-            key = m.group(1)
-            val = m.group(2).strip()
-            # Try numeric conversion
-            try:
-                val = int(val)  # type: ignore[assignment]
-            except ValueError:
-                try:
+        else:
+            val = m.group("val").strip()
+            if _ERS_NUMBER.fullmatch(val):
+                if "." in val or "e" in val or "E" in val:
                     val = float(val)  # type: ignore[assignment]
-                except ValueError:
-                    pass
-            stack[-1][key] = val
+                else:
+                    val = int(val)  # type: ignore[assignment]
+            stack[-1][m.group("key")] = val
 
     return result
 
@@ -79,14 +83,19 @@ class ERMapperParser(BaseParser):
 
         If *data* is the ASCII header, it returns metadata only.
         """
-        result = ParseResult(format_name="ER Mapper")
-
         try:
-            text = data.decode("ascii", errors="replace")
+            # bytes() is a no-op for bytes input but materialises mmap
+            # buffers, which have no decode of their own
+            text = bytes(data).decode("ascii", errors="replace")
         except Exception:
+            result = ParseResult(format_name="ER Mapper")
             result.errors.append("Could not decode header as ASCII")
             return result
+        return self._parse_text(text)
 
+    def _parse_text(self, text: str) -> ParseResult:
+        """Parse already-decoded ``.ers`` header text."""
+        result = ParseResult(format_name="ER Mapper")
         header = _parse_ers_header(text)
         result.header = header
 
@@ -109,14 +118,17 @@ class ERMapperParser(BaseParser):
     def parse_file(self, path: str | Path, config: FormatConfig | None = None) -> ParseResult:
         """Parse an ``.ers`` header file and optionally its companion binary."""
         path = Path(path)
-        with open(path, "rb") as fh:
-            header_data = fh.read()
-        result = self.parse(header_data, config)
+        # The header is ASCII text; decoding while reading avoids holding
+        # both a bytes and a str copy of it
+        with open(path, "r", encoding="ascii", errors="replace") as fh:
+            result = self._parse_text(fh.read())
+        self.finalize_from_path(result, path, config)
+        return result
 
-        # Try to locate the companion binary
+    def finalize_from_path(self, result: ParseResult, path: Path,
+                           config: FormatConfig | None = None) -> None:
+        """Record the companion binary sitting next to the ``.ers`` header."""
         bin_path = path.with_suffix("")
         if bin_path.exists() and bin_path.is_file():
             result.metadata["binary_path"] = str(bin_path)
             result.metadata["binary_size"] = bin_path.stat().st_size
-
-        return result
@@ -12,28 +12,67 @@ beyond the standard library.
 from __future__ import annotations
 
 import array
+import functools
 import struct
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from geodatarev.config import FormatConfig
 from geodatarev.parsers import BaseParser, ParseResult
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
 HEADER_SIZE = 512
 
-# Dummy (NoData) sentinel values per array type code
-_DUMMIES = {
-    "b": -127,
-    "B": 255,
-    "h": -32767,
-    "H": 65535,
-    "i": -2147483647,
-    "I": 4294967295,
-    "f": -1e32,
-    "d": -1e32,
+# Dummy (NoData) sentinel per array type code: (is_float, sentinel).
+# Float grids treat anything at or below the sentinel as NoData; integer
+# grids match it exactly.
+_DUMMY_INFO = {
+    "b": (False, -127),
+    "B": (False, 255),
+    "h": (False, -32767),
+    "H": (False, 65535),
+    "i": (False, -2147483647),
+    "I": (False, 4294967295),
+    "f": (True, -1e32),
+    "d": (True, -1e32),
 }
 
-VALID_ES = (1, 2, 4, 8, 1025, 1026, 1028, 1032)
+VALID_ES = frozenset({1, 2, 4, 8, 1025, 1026, 1028, 1032})
+
+# Numba kernels are loaded on first parse, not at import time; importing
+# numba is slow and most callers never touch a Geosoft payload.
+_scale_payload = None
+_kernels_checked = False
+
+
+def _jit_scale_payload():
+    """Return the numba scaling kernel, or None when numba is absent."""
+    global _scale_payload, _kernels_checked
+    if not _kernels_checked:
+        _kernels_checked = True
+        from geodatarev.parsers._geosoft_kernels import scale_payload
+        _scale_payload = scale_payload
+    return _scale_payload
+
+
+# Header and compression-directory layouts, compiled once; unpack_from
+# with a literal format re-parses the format string on every call
+_I32 = struct.Struct("<i")
+_HDR_5I = struct.Struct("<5i")
+_HDR_5D = struct.Struct("<5d")
+_HDR_2D = struct.Struct("<2d")
+_COMP_COUNTS = struct.Struct("<2i")
+
+
+@functools.lru_cache(maxsize=32)
+def _block_structs(n_blocks: int) -> tuple[struct.Struct, struct.Struct]:
+    """Compiled (offsets, sizes) structs for an *n_blocks* directory."""
+    return struct.Struct(f"<{n_blocks}q"), struct.Struct(f"<{n_blocks}i")
 
 
 def _data_type_code(es: int, sf: int) -> str:
@@ -51,26 +90,31 @@ def _data_type_code(es: int, sf: int) -> str:
 
 def _decompress(payload: bytes) -> bytes:
     """Decompress a Geosoft zlib-compressed grid payload."""
-    n_blocks = struct.unpack_from("<i", payload, 8)[0]
-    _vecs_per_block = struct.unpack_from("<i", payload, 12)[0]
-    off = 16
-    block_offsets = struct.unpack_from(f"<{n_blocks}q", payload, off)
-    off += n_blocks * 8
-    block_sizes = struct.unpack_from(f"<{n_blocks}i", payload, off)
-
-    parts: list[bytes] = []
+    n_blocks, _vecs_per_block = _COMP_COUNTS.unpack_from(payload, 8)
+    offsets_struct, sizes_struct = _block_structs(n_blocks)
+    block_offsets = offsets_struct.unpack_from(payload, 16)
+    block_sizes = sizes_struct.unpack_from(payload, 16 + n_blocks * 8)
+
+    blocks = []
     for i in range(n_blocks):
         start = block_offsets[i] - HEADER_SIZE + 16
-        end = start + block_sizes[i]
-        parts.append(zlib.decompress(payload[start:end]))
+        blocks.append(payload[start:start + block_sizes[i]])
+
+    if n_blocks >= 4:
+        # zlib releases the GIL while inflating, so independent blocks
+        # decompress concurrently on a thread pool.
+        with ThreadPoolExecutor(max_workers=min(n_blocks, 8)) as ex:
+            parts = list(ex.map(zlib.decompress, blocks))
+    else:
+        parts = [zlib.decompress(b) for b in blocks]
     return b"".join(parts)
 
 
 def _read_header(hdr: bytes) -> dict:
     """Parse the 512-byte Geosoft grid header."""
-    es, sf, ne, nv, kx = struct.unpack_from("<5i", hdr, 0)
-    de, dv, x0, y0, rot = struct.unpack_from("<5d", hdr, 20)
-    zbase, zmult = struct.unpack_from("<2d", hdr, 60)
+    es, sf, ne, nv, kx = _HDR_5I.unpack_from(hdr, 0)
+    de, dv, x0, y0, rot = _HDR_5D.unpack_from(hdr, 20)
+    zbase, zmult = _HDR_2D.unpack_from(hdr, 60)
     return {
         "n_bytes_per_element": es,
         "sign_flag": sf,
@@ -97,14 +141,16 @@ class GeosoftParser(BaseParser):
         # Reject files that match other known .grd magics
         if data[:4] in (b"DSBB", b"DSRB", b"DSAA"):
             return False
+        # Cheap pre-filters: ES and KX alone reject most non-Geosoft
+        # files before the full header unpack
+        if _I32.unpack_from(data, 0)[0] not in VALID_ES:
+            return False
+        if _I32.unpack_from(data, 16)[0] not in (-1, 1):
+            return False
         try:
             hdr = _read_header(data[:HEADER_SIZE])
         except Exception:
             return False
-        if hdr["n_bytes_per_element"] not in VALID_ES:
-            return False
-        if hdr["ordering"] not in (-1, 1):
-            return False
         if hdr["sign_flag"] not in (0, 1, 2, 3):
             return False
         if hdr["sign_flag"] == 3:
@@ -140,27 +186,60 @@ class GeosoftParser(BaseParser):
                 result.errors.append(f"Decompression failed: {exc}")
                 return result
 
+        is_float, dummy = _DUMMY_INFO[tc]
+        zmult = hdr["data_factor"]
+        zbase = hdr["base_value"]
+
+        if np is not None:
+            # Vectorized path: mask dummies and scale the whole payload
+            # at once; NoData comes back as NaN instead of None
+            try:
+                raw = np.frombuffer(payload, dtype=np.dtype("<" + tc))
+            except ValueError as exc:
+                result.errors.append(f"Array decode failed: {exc}")
+                return result
+            kernel = _jit_scale_payload()
+            if kernel is not None:
+                out, null_count = kernel(raw, is_float, dummy, zmult, zbase)
+                result.data = out
+                result.metadata["null_count"] = null_count
+                return result
+            mask = (raw <= dummy) if is_float else (raw == dummy)
+            out = raw.astype(np.float64)
+            np.divide(out, zmult, out=out)
+            out += zbase
+            out[mask] = np.nan
+            result.data = out
+            result.metadata["null_count"] = int(mask.sum())
+            return result
+
         try:
             values = array.array(tc, payload)
         except Exception as exc:
             result.errors.append(f"Array decode failed: {exc}")
             return result
 
-        # Replace dummies with None, apply scaling
-        dummy = _DUMMIES.get(tc)
+        # Replace dummies with None, apply scaling.  Divide rather than
+        # multiply by a reciprocal so the values are bit-identical with
+        # the numpy and numba paths.
+        null_count = 0
         scaled: list[float | None] = []
-        zmult = hdr["data_factor"]
-        zbase = hdr["base_value"]
-        for v in values:
-            if dummy is not None:
-                if tc in ("f", "d") and v <= dummy:
-                    scaled.append(None)
-                    continue
-                elif tc not in ("f", "d") and v == dummy:
-                    scaled.append(None)
-                    continue
-            scaled.append(v / zmult + zbase)
+        append = scaled.append
+        if is_float:
+            for v in values:
+                if v <= dummy:
+                    append(None)
+                    null_count += 1
+                else:
+                    append(v / zmult + zbase)
+        else:
+            for v in values:
+                if v == dummy:
+                    append(None)
+                    null_count += 1
+                else:
+                    append(v / zmult + zbase)
 
         result.data = scaled
-        result.metadata["null_count"] = sum(1 for v in scaled if v is None)
+        result.metadata["null_count"] = null_count
         return result
@@ -20,15 +20,29 @@ import struct
 from geodatarev.config import FormatConfig
 from geodatarev.parsers import BaseParser, ParseResult
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
 SURFER6_MAGIC = b"DSBB"
 HEADER_SIZE = 56
 
+# Whole header after the magic in one compiled struct; literal format
+# strings are re-parsed on every unpack_from call
+_HDR = struct.Struct("<HH6d")
+# Magic as a little-endian uint32: one integer compare in can_parse
+# instead of allocating a 4-byte slice per probed file
+_U32 = struct.Struct("<I")
+_MAGIC_U32 = int.from_bytes(SURFER6_MAGIC, "little")
+
 
 class Surfer6Parser(BaseParser):
     name = "surfer6"
+    magic = SURFER6_MAGIC
 
     def can_parse(self, data: bytes, config: FormatConfig | None = None) -> bool:
-        return len(data) >= HEADER_SIZE and data[:4] == SURFER6_MAGIC
+        return len(data) >= HEADER_SIZE and _U32.unpack_from(data)[0] == _MAGIC_U32
 
     def parse(self, data: bytes, config: FormatConfig | None = None) -> ParseResult:
         result = ParseResult(format_name="Surfer 6 Binary Grid")
@@ -42,8 +56,7 @@ class Surfer6Parser(BaseParser):
             result.errors.append(f"Invalid magic: {magic!r}")
             return result
 
-        nx, ny = struct.unpack_from("<HH", data, 4)
-        xlo, xhi, ylo, yhi, zlo, zhi = struct.unpack_from("<6d", data, 8)
+        nx, ny, xlo, xhi, ylo, yhi, zlo, zhi = _HDR.unpack_from(data, 4)
 
         result.header = {
             "nx": nx, "ny": ny,
@@ -63,6 +76,14 @@ class Surfer6Parser(BaseParser):
             )
 
         n_values = len(payload) // 4
-        values = list(struct.unpack_from(f"<{n_values}f", payload))
-        result.data = values
+        if np is not None:
+            # Zero-copy view over the payload: no boxed floats, no list
+            arr = np.frombuffer(payload, dtype="<f4", count=n_values)
+            result.data = arr
+            if n_values:
+                # Vectorised range stats while the payload is hot in cache
+                result.metadata["value_min"] = float(arr.min())
+                result.metadata["value_max"] = float(arr.max())
+        else:
+            result.data = list(struct.unpack_from(f"<{n_values}f", payload))
         return result
@@ -13,29 +13,44 @@ import struct
 from geodatarev.config import FormatConfig
 from geodatarev.parsers import BaseParser, ParseResult
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
 SURFER7_MAGIC = b"DSRB"
 TAG_HEADER = 0x42525344
 TAG_GRID = 0x44495247
 
+# Compiled once; literal format strings are re-parsed on every
+# unpack_from call, which adds up across a tag walk
+_TAG = struct.Struct("<II")
+_GRID_HDR = struct.Struct("<II8d")
+# Magic as a little-endian uint32: one integer compare in can_parse
+# instead of allocating a 4-byte slice per probed file
+_U32 = struct.Struct("<I")
+_MAGIC_U32 = int.from_bytes(SURFER7_MAGIC, "little")
+
 
 def _read_tag(data: bytes, offset: int) -> tuple[int, int, int]:
     """Read a tag id and size, return (id, size, next_offset)."""
     if offset + 8 > len(data):
         return 0, 0, len(data)
-    tag_id, tag_size = struct.unpack_from("<II", data, offset)
+    tag_id, tag_size = _TAG.unpack_from(data, offset)
     return tag_id, tag_size, offset + 8
 
 
 class Surfer7Parser(BaseParser):
     name = "surfer7"
+    magic = SURFER7_MAGIC
 
     def can_parse(self, data: bytes, config: FormatConfig | None = None) -> bool:
-        return len(data) >= 8 and data[:4] == SURFER7_MAGIC
+        return len(data) >= 8 and _U32.unpack_from(data)[0] == _MAGIC_U32
 
     def parse(self, data: bytes, config: FormatConfig | None = None) -> ParseResult:
         result = ParseResult(format_name="Surfer 7 Binary Grid")
 
-        if len(data) < 8 or data[:4] != SURFER7_MAGIC:
+        if len(data) < 8 or _U32.unpack_from(data)[0] != _MAGIC_U32:
             result.errors.append("Not a valid Surfer 7 file")
             return result
 
@@ -63,10 +78,8 @@ class Surfer7Parser(BaseParser):
         # Grid section header (72 bytes):
         # ny(4) + nx(4) + xlo(8) + ylo(8) + xsize(8) + ysize(8) +
         # zmin(8) + zmax(8) + rotation(8) + blank_value(8)
-        ny, nx = struct.unpack_from("<II", data, offset)
-        xlo, ylo, xsize, ysize, zmin, zmax, rotation, blank_value = struct.unpack_from(
-            "<8d", data, offset + 8,
-        )
+        (ny, nx, xlo, ylo, xsize, ysize,
+         zmin, zmax, rotation, blank_value) = _GRID_HDR.unpack_from(data, offset)
 
         result.header = {
             "nx": nx, "ny": ny,
@@ -83,8 +96,15 @@ class Surfer7Parser(BaseParser):
 
         n_values = len(payload) // 8
         if n_values > 0:
-            values = list(struct.unpack_from(f"<{n_values}d", payload))
-            result.data = values
+            if np is not None:
+                # Zero-copy view over the payload: no boxed floats, no list
+                arr = np.frombuffer(payload, dtype="<f8", count=n_values)
+                result.data = arr
+                # Vectorised range stats while the payload is hot in cache
+                result.metadata["value_min"] = float(arr.min())
+                result.metadata["value_max"] = float(arr.max())
+            else:
+                result.data = list(struct.unpack_from(f"<{n_values}d", payload))
 
         if len(payload) < expected_bytes:
             result.errors.append("Grid payload truncated")
@@ -23,6 +23,31 @@ from pathlib import Path
 from geodatarev.config import FormatConfig
 from geodatarev.parsers import BaseParser, ParseResult
 
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator (the "fast" extra)
+    np = None
+
+
+# Lines opening with '@' (possibly indented, as the old line-stripping
+# loop tolerated) bound the structured header section
+_AT_LINE_RE = re.compile(r"^[ \t]*@", re.MULTILINE)
+
+# Numba kernel loaded on first parse, not at import time; importing
+# numba is slow and most callers never touch a ZMap grid.
+_classify_nulls = None
+_kernels_checked = False
+
+
+def _jit_classify_nulls():
+    """Return the numba null-classification kernel, or None without numba."""
+    global _classify_nulls, _kernels_checked
+    if not _kernels_checked:
+        _kernels_checked = True
+        from geodatarev.parsers._zmap_kernels import classify_nulls
+        _classify_nulls = classify_nulls
+    return _classify_nulls
+
 
 def _is_zmap(text: str) -> bool:
     """Quick check for ZMap+ structure."""
@@ -43,17 +68,34 @@ class ZMapParser(BaseParser):
     def parse(self, data: bytes, config: FormatConfig | None = None) -> ParseResult:
         result = ParseResult(format_name="ZMap+ ASCII Grid")
         try:
-            text = data.decode("ascii", errors="replace")
+            # bytes() is a no-op for bytes input but materialises mmap
+            # buffers, which have no decode of their own
+            text = bytes(data).decode("ascii", errors="replace")
         except Exception:
             result.errors.append("Could not decode as ASCII")
             return result
 
-        lines = text.splitlines()
+        # Slice the header region out first — everything up to and
+        # including the closing '@' line — so the per-line header logic
+        # below runs over a dozen lines, not the whole (possibly huge)
+        # file, and the data region never goes through splitlines.
+        data_region = text
+        header_region = text
+        marks = _AT_LINE_RE.finditer(text)
+        if next(marks, None) is not None:
+            closing = next(marks, None)
+            if closing is not None:
+                cut = text.find("\n", closing.start())
+                if cut >= 0:
+                    header_region = text[:cut]
+                    data_region = text[cut + 1:]
+                else:
+                    data_region = ""
+
         header: dict = {}
-        data_start = 0
         in_header = False
 
-        for i, line in enumerate(lines):
+        for line in header_region.splitlines():
             stripped = line.strip()
             if not stripped:
                 continue
@@ -75,9 +117,8 @@ class ZMapParser(BaseParser):
                         pass
                 continue
             if stripped.startswith("@") and in_header:
-                # Closing @ — data starts next line
+                # Closing @ — the data region begins after this line
                 in_header = False
-                data_start = i + 1
                 continue
             if in_header:
                 # Parse header rows
@@ -109,15 +150,42 @@ class ZMapParser(BaseParser):
 
         # Parse data values
         null_val = header.get("null_value", 1e30)
+        null_floor = abs(null_val) * 0.99
+        if "!" in data_region or "@" in data_region:
+            # Stray comment/delimiter lines inside the data region are
+            # rare; only then pay for a line-level filter
+            data_region = "\n".join(
+                line for line in data_region.splitlines()
+                if line.strip() and not line.lstrip().startswith(("!", "@"))
+            )
+
+        if np is not None:
+            # One C-level conversion per token over the whole data
+            # region, then a vectorised null mask; NoData comes back as
+            # NaN instead of None.  A token the converter rejects (stray
+            # words, comma-joined values) drops to the skip-tolerant
+            # scalar loop below, matching the old per-token behaviour.
+            try:
+                arr = np.array(data_region.split(), dtype=np.float64)
+            except ValueError:
+                arr = None
+            if arr is not None:
+                kernel = _jit_classify_nulls()
+                if kernel is not None:
+                    result.metadata["null_count"] = kernel(arr, null_floor)
+                else:
+                    null_mask = np.abs(arr) >= null_floor
+                    arr[null_mask] = np.nan
+                    result.metadata["null_count"] = int(null_mask.sum())
+                result.data = arr
+                return result
+
         values: list[float | None] = []
-        for line in lines[data_start:]:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("!") or stripped.startswith("@"):
-                continue
-            for token in stripped.split():
+        for line in data_region.splitlines():
+            for token in line.split():
                 try:
                     v = float(token)
-                    values.append(None if abs(v) >= abs(null_val) * 0.99 else v)
+                    values.append(None if abs(v) >= null_floor else v)
                 except ValueError:
                     continue
 
@@ -8,8 +8,11 @@ supported via ``s3://`` and ``az://`` URIs.
 
 from __future__ import annotations
 
+import mmap
 import os
+import stat
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -47,6 +50,43 @@ class FileReport:
     errors: list[str] = field(default_factory=list)
 
 
+def read_headers(
+    paths: list[Path], nbytes: int = 4096, max_workers: int = 16
+) -> list[bytes]:
+    """Read the first *nbytes* of many files concurrently.
+
+    Header sniffing over thousands of small files is dominated by
+    per-file open/read latency; overlapping the reads in a thread pool
+    (the reads release the GIL) keeps the device queue full.
+
+    Parameters
+    ----------
+    paths : list[Path]
+        Files to read.
+    nbytes : int
+        Bytes to read from the start of each file.
+    max_workers : int
+        Maximum concurrent reads.
+
+    Returns
+    -------
+    list[bytes]
+        Header bytes in the same order as *paths*; unreadable files
+        yield ``b""``.
+    """
+    def _read(path: Path) -> bytes:
+        try:
+            with open(path, "rb") as fh:
+                return fh.read(nbytes)
+        except OSError:
+            return b""
+
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(_read, paths))
+
+
 # Built-in parser registry
 _BUILTIN_PARSERS: list[BaseParser] = [
     Surfer6Parser(),
@@ -79,6 +119,10 @@ class DirectoryScanner:
         A pre-configured cloud storage provider.  When *None*, one is
         created automatically from the URI scheme when a cloud path is
         scanned.
+    max_workers : int or None
+        Thread count for :meth:`scan_directory`.  Defaults to
+        ``min(32, 4 * cpu_count)``; per-file scanning is dominated by
+        open/read/stat calls that release the GIL.
     """
 
     def __init__(
@@ -89,6 +133,7 @@ class DirectoryScanner:
         max_sample: int = 1_048_576,
         check_gdal: bool = False,
         cloud_provider: CloudStorageProvider | None = None,
+        max_workers: int | None = None,
     ):
         self.configs = configs if configs is not None else load_config()
         self.identifier = FileIdentifier(self.configs)
@@ -96,9 +141,21 @@ class DirectoryScanner:
         self.parsers: list[BaseParser] = list(_BUILTIN_PARSERS)
         if parsers:
             self.parsers.extend(parsers)
+        # Magic-prefixed parsers dispatch in O(1) on the first four
+        # bytes; the rest (content-sniffing formats) are probed in order
+        self._magic_dispatch: dict[bytes, BaseParser] = {}
+        self._fallback_parsers: list[BaseParser] = []
+        for parser in self.parsers:
+            if parser.magic is not None:
+                self._magic_dispatch.setdefault(parser.magic, parser)
+            else:
+                self._fallback_parsers.append(parser)
         self.extensions = extensions
         self.check_gdal = check_gdal
         self.cloud_provider = cloud_provider
+        if max_workers is None:
+            max_workers = min(32, 4 * (os.cpu_count() or 4))
+        self.max_workers = max_workers
 
     def scan_file(self, path: str | Path) -> FileReport:
         """Analyse a single file.
@@ -115,51 +172,40 @@ class DirectoryScanner:
         path = Path(path)
         report = FileReport(path=str(path))
 
-        if not path.is_file():
+        # One stat answers existence, type and size; is_file() + stat()
+        # cost two syscalls for the same information
+        try:
+            st = os.stat(path)
+        except OSError:
+            report.errors.append("Not a file")
+            return report
+        if not stat.S_ISREG(st.st_mode):
             report.errors.append("Not a file")
             return report
 
-        report.size = path.stat().st_size
+        report.size = st.st_size
         if report.size == 0:
             report.errors.append("Empty file")
             return report
 
-        # Identify
-        try:
-            matches = self.identifier.identify_file(path)
-            report.identified_formats = [m.name for m in matches]
-        except Exception as exc:
-            report.errors.append(f"Identification error: {exc}")
-
-        # Disambiguate overloaded extensions when magic-byte ID is inconclusive
-        if not report.identified_formats:
-            try:
-                with open(path, "rb") as fh:
-                    sample = fh.read(min(report.size, 8192))
-                ext = path.suffix.lower()
-                if ext == ".dat":
-                    report.identified_formats = [classify_dat(sample, path)]
-                elif ext == ".grd":
-                    report.identified_formats = [classify_grd(sample, path)]
-            except Exception as exc:
-                report.errors.append(f"Disambiguation error: {exc}")
-
-        # Analyse
-        try:
-            report.analysis = self.analyzer.analyze_file(path)
-        except Exception as exc:
-            report.errors.append(f"Analysis error: {exc}")
-
-        # Parse with first matching parser
+        # Map the file once and run identification, disambiguation,
+        # analysis and parsing over the shared buffer; these stages used
+        # to re-open and re-read the file three times each.  Parsers only
+        # slice headers and payloads out of the mapping, so closing it
+        # afterwards is safe.
         try:
             with open(path, "rb") as fh:
-                head = fh.read(self.analyzer.max_sample)
-            for parser in self.parsers:
-                if parser.can_parse(head):
-                    report.parse_result = parser.parse_file(path)
-                    break
-        except Exception as exc:
-            report.errors.append(f"Parse error: {exc}")
+                try:
+                    buf: Any = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    buf = fh.read()
+                try:
+                    self._scan_bytes(report, buf, path.name, path=path)
+                finally:
+                    if isinstance(buf, mmap.mmap):
+                        buf.close()
+        except OSError as exc:
+            report.errors.append(f"Read error: {exc}")
 
         # GDAL compatibility check
         if self.check_gdal:
@@ -185,6 +231,10 @@ class DirectoryScanner:
         recursive : bool
             Whether to recurse into subdirectories.
 
+        Local files are scanned concurrently on a thread pool sized by
+        the ``max_workers`` constructor parameter; reports come back in
+        sorted path order regardless.
+
         Returns
         -------
         list[FileReport]
@@ -193,23 +243,69 @@ class DirectoryScanner:
         if isinstance(root, str) and is_cloud_uri(root):
             return self.scan_cloud(root, recursive=recursive)
 
+        files = self._list_local_files(root, recursive)
+        if not files:
+            return []
+        workers = min(self.max_workers, len(files))
+        if workers <= 1:
+            return [self.scan_file(f) for f in files]
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(self.scan_file, files))
+
+    def _list_local_files(self, root: str | Path, recursive: bool) -> list[Path]:
+        """Enumerate scannable files under *root* in sorted order."""
         root = Path(root)
-        reports: list[FileReport] = []
-
         if not root.is_dir():
-            return reports
+            return []
+        return [
+            path for path in self._walk(root, recursive)
+            if self.extensions is None or path.suffix.lower() in self.extensions
+        ]
+
+    def _walk(self, root: Path, recursive: bool):
+        """Yield files under *root* depth-first, each directory sorted.
+
+        ``os.scandir`` answers is_file/is_dir from the directory entry
+        itself, so the walk avoids the per-path stat() that rglob +
+        is_file() pays, and sorting per directory keeps the traversal
+        deterministic without materialising the whole tree first.
+        """
+        try:
+            with os.scandir(root) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from self._walk(Path(entry.path), recursive)
+            elif entry.is_file(follow_symlinks=False):
+                yield Path(entry.path)
+
+    def iter_directory(self, root: str | Path, recursive: bool = True):
+        """Lazily scan a directory tree, yielding one report at a time.
+
+        Behaves like :meth:`scan_directory` but as a generator, so peak
+        memory stays flat regardless of how many files are scanned —
+        useful for streaming output over very large data stores.
 
-        iterator = root.rglob("*") if recursive else root.glob("*")
+        Parameters
+        ----------
+        root : str or Path
+            Root directory or cloud URI to scan.
+        recursive : bool
+            Whether to recurse into subdirectories.
 
-        for entry in sorted(iterator):
-            if not entry.is_file():
-                continue
-            if self.extensions is not None:
-                if entry.suffix.lower() not in self.extensions:
-                    continue
-            reports.append(self.scan_file(entry))
+        Yields
+        ------
+        FileReport
+        """
+        if isinstance(root, str) and is_cloud_uri(root):
+            yield from self.scan_cloud(root, recursive=recursive)
+            return
 
-        return reports
+        for entry in self._list_local_files(root, recursive):
+            yield self.scan_file(entry)
 
     def scan_cloud(self, uri: str, recursive: bool = True) -> list[FileReport]:
         """Scan a cloud storage location for binary data files.
@@ -237,18 +333,33 @@ class DirectoryScanner:
             bucket, prefix, recursive=recursive, extensions=self.extensions
         )
 
-        reports: list[FileReport] = []
-        for obj in objects:
-            cloud_path = f"{scheme}://{bucket}/{obj.key}"
-            report = FileReport(path=cloud_path)
-            report.size = obj.size
+        if not objects:
+            return []
+        workers = min(self.max_workers, len(objects))
+        if workers <= 1:
+            return [self._scan_cloud_object(provider, scheme, bucket, obj)
+                    for obj in objects]
+        # Each object is an independent download + analysis, dominated
+        # by network round-trips, so overlap them on the scan pool
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(
+                lambda obj: self._scan_cloud_object(provider, scheme, bucket, obj),
+                objects,
+            ))
+
+    def _scan_cloud_object(self, provider: CloudStorageProvider, scheme: str,
+                           bucket: str, obj) -> FileReport:
+        """Download one cloud object to scratch space and analyse it."""
+        report = FileReport(path=f"{scheme}://{bucket}/{obj.key}")
+        report.size = obj.size
 
-            if report.size == 0:
-                report.errors.append("Empty file")
-                reports.append(report)
-                continue
+        if report.size == 0:
+            report.errors.append("Empty file")
+            return report
 
-            try:
+        try:
+            if self.check_gdal:
+                # GDAL needs a real path, so keep the temp-file route
                 with tempfile.TemporaryDirectory() as td:
                     local = provider.download(bucket, obj.key, Path(td) / obj.name)
                     inner = self.scan_file(local)
@@ -259,9 +370,61 @@ class DirectoryScanner:
                 report.parse_result = inner.parse_result
                 report.gdal_result = inner.gdal_result
                 report.errors = inner.errors
+            else:
+                # All parsers accept bytes, so analyse the download
+                # in memory and skip the write + re-read entirely
+                self._scan_bytes(report, provider.download_bytes(bucket, obj.key),
+                                 obj.name)
+        except Exception as exc:
+            report.errors.append(f"Cloud download/analysis error: {exc}")
+
+        return report
+
+    def _scan_bytes(self, report: FileReport, data: Any, name: str,
+                    path: Path | None = None) -> None:
+        """Run identification, analysis and parsing over one buffer.
+
+        *data* may be bytes or a read-only mmap; every stage slices what
+        it needs.  *path* is passed to the extension disambiguators,
+        which can look at companion files when it is a real local path.
+        """
+        try:
+            matches = self.identifier.identify_bytes(data)
+            report.identified_formats = [m.name for m in matches]
+        except Exception as exc:
+            report.errors.append(f"Identification error: {exc}")
+
+        # Disambiguate overloaded extensions when magic-byte ID is inconclusive
+        if not report.identified_formats:
+            try:
+                sample = data[:8192]
+                ext = Path(name).suffix.lower()
+                if ext == ".dat":
+                    report.identified_formats = [classify_dat(sample, path)]
+                elif ext == ".grd":
+                    report.identified_formats = [classify_grd(sample, path)]
             except Exception as exc:
-                report.errors.append(f"Cloud download/analysis error: {exc}")
+                report.errors.append(f"Disambiguation error: {exc}")
 
-            reports.append(report)
+        # Analyse
+        try:
+            report.analysis = self.analyzer.analyze_data(data)
+        except Exception as exc:
+            report.errors.append(f"Analysis error: {exc}")
 
-        return reports
+        # Parse with first matching parser
+        try:
+            parser = self._magic_dispatch.get(bytes(data[:4]))
+            if parser is not None and parser.can_parse(data):
+                report.parse_result = parser.parse(data)
+            else:
+                for parser in self._fallback_parsers:
+                    if parser.can_parse(data):
+                        report.parse_result = parser.parse(data)
+                        break
+            if report.parse_result is not None and path is not None:
+                # Companion-file discovery (e.g. the ER Mapper binary)
+                # needs the real path, which the shared buffer never sees
+                parser.finalize_from_path(report.parse_result, path)
+        except Exception as exc:
+            report.errors.append(f"Parse error: {exc}")
@@ -7,6 +7,30 @@ from pathlib import Path
 
 import pytest
 
+try:
+    import numpy as np
+except ImportError:  # fixtures fall back to struct.pack without numpy
+    np = None
+
+# Precompiled fixture layouts
+_SURFER6_HDR = struct.Struct("<HH6d")
+_SURFER7_GRID_HDR = struct.Struct("<II8d")
+_TAG = struct.Struct("<II")
+
+
+def _f32_payload(values):
+    """Pack *values* as little-endian float32 — C memcpy when numpy is here."""
+    if np is not None:
+        return np.asarray(values, dtype="<f4").tobytes()
+    return struct.pack(f"<{len(values)}f", *values)
+
+
+def _f64_payload(values):
+    """Pack *values* as little-endian float64."""
+    if np is not None:
+        return np.asarray(values, dtype="<f8").tobytes()
+    return struct.pack(f"<{len(values)}d", *values)
+
 
 @pytest.fixture
 def tmp_dir(tmp_path):
@@ -14,28 +38,27 @@ def tmp_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def surfer6_bytes():
     """Build a minimal Surfer 6 binary grid (3x2)."""
     nx, ny = 3, 2
     xlo, xhi = 0.0, 10.0
     ylo, yhi = 0.0, 5.0
     zlo, zhi = -1.0, 1.0
-    header = b"DSBB" + struct.pack("<HH6d", nx, ny, xlo, xhi, ylo, yhi, zlo, zhi)
+    header = b"DSBB" + _SURFER6_HDR.pack(nx, ny, xlo, xhi, ylo, yhi, zlo, zhi)
     values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
-    payload = struct.pack(f"<{len(values)}f", *values)
-    return header + payload
+    return header + _f32_payload(values)
 
 
-@pytest.fixture
-def surfer6_file(tmp_dir, surfer6_bytes):
-    """Write a Surfer 6 grid to a temp file and return its path."""
-    p = tmp_dir / "sample.grd"
+@pytest.fixture(scope="session")
+def surfer6_file(tmp_path_factory, surfer6_bytes):
+    """Write a Surfer 6 grid to a temp file once per session."""
+    p = tmp_path_factory.mktemp("surfer6") / "sample.grd"
     p.write_bytes(surfer6_bytes)
     return p
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def surfer7_bytes():
     """Build a minimal Surfer 7 binary grid (2x2)."""
     nx, ny = 2, 2
@@ -44,11 +67,10 @@ def surfer7_bytes():
     zmin, zmax = 0.0, 4.0
     rotation = 0.0
     blank = 1.70141e+38
-    grid_header = struct.pack("<II8d", ny, nx, xlo, ylo, xsize, ysize,
-                              zmin, zmax, rotation, blank)
+    grid_header = _SURFER7_GRID_HDR.pack(ny, nx, xlo, ylo, xsize, ysize,
+                                         zmin, zmax, rotation, blank)
     values = [1.0, 2.0, 3.0, 4.0]
-    payload = struct.pack(f"<{len(values)}d", *values)
-    grid_content = grid_header + payload
+    grid_content = grid_header + _f64_payload(values)
 
     # Surfer 7 structure: DSRB header tag (id=0x42525344, size=4, version)
     # followed by GRID tag (id=0x44495247, size=N, grid data)
@@ -56,20 +78,20 @@ def surfer7_bytes():
     grid_tag_id = 0x44495247     # "GRID" as LE uint32
     version = struct.pack("<I", 2)
     file_data = (
-        struct.pack("<II", header_tag_id, len(version)) + version
-        + struct.pack("<II", grid_tag_id, len(grid_content)) + grid_content
+        _TAG.pack(header_tag_id, len(version)) + version
+        + _TAG.pack(grid_tag_id, len(grid_content)) + grid_content
     )
     return file_data
 
 
-@pytest.fixture
-def surfer7_file(tmp_dir, surfer7_bytes):
-    p = tmp_dir / "sample7.grd"
+@pytest.fixture(scope="session")
+def surfer7_file(tmp_path_factory, surfer7_bytes):
+    p = tmp_path_factory.mktemp("surfer7") / "sample7.grd"
     p.write_bytes(surfer7_bytes)
     return p
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ers_header_bytes():
     """Build a minimal ER Mapper .ers header."""
     text = """\
@@ -90,8 +112,31 @@ DatasetHeader End
     return text.encode("ascii")
 
 
-@pytest.fixture
-def ers_file(tmp_dir, ers_header_bytes):
-    p = tmp_dir / "raster.ers"
+@pytest.fixture(scope="session")
+def zmap_bytes():
+    """Build a minimal ZMap+ ASCII grid (3x2)."""
+    text = """\
+! ZIMS FILE NAME : example
+@example HEADER, GRID, 5
+15, 1.0E+30, , 7, 1
+2, 3, 0.0, 30.0, 0.0, 20.0
+0.0, 0.0, 0.0
+@
+1.0 2.0 3.0
+4.0 5.0 6.0
+"""
+    return text.encode("ascii")
+
+
+@pytest.fixture(scope="session")
+def zmap_file(tmp_path_factory, zmap_bytes):
+    p = tmp_path_factory.mktemp("zmap") / "grid.dat"
+    p.write_bytes(zmap_bytes)
+    return p
+
+
+@pytest.fixture(scope="session")
+def ers_file(tmp_path_factory, ers_header_bytes):
+    p = tmp_path_factory.mktemp("ers") / "raster.ers"
     p.write_bytes(ers_header_bytes)
     return p
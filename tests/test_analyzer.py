@@ -127,6 +127,17 @@ class TestBinaryAnalyzer:
         assert result.entropy > 0
         assert 32 in result.bit_width_scores
 
+    def test_analyze_files(self, tmp_dir):
+        paths = []
+        for i in range(4):
+            p = tmp_dir / f"file{i}.bin"
+            p.write_bytes(bytes([i]) * 64 + struct.pack("<8f", *range(8)))
+            paths.append(p)
+        analyzer = BinaryAnalyzer()
+        results = analyzer.analyze_files(paths, workers=2)
+        assert len(results) == 4
+        assert [r.file_size for r in results] == [p.stat().st_size for p in paths]
+
     def test_analyze_data_has_endianness(self):
         data = struct.pack("<10f", *range(10))
         analyzer = BinaryAnalyzer()
@@ -93,6 +93,15 @@ class TestCloudObject:
         obj = CloudObject(key="README")
         assert obj.suffix == ""
 
+    def test_suffix_ignores_dotted_directories(self):
+        obj = CloudObject(key="survey.v2/data")
+        assert obj.suffix == ""
+
+    def test_frozen(self):
+        obj = CloudObject(key="a.grd")
+        with pytest.raises(Exception):
+            obj.key = "b.grd"
+
 
 # ---------------------------------------------------------------------------
 # get_provider factory
@@ -195,6 +204,14 @@ class TestS3StorageProvider:
         client.download_file.assert_called_once_with("bucket", "data/file.grd", str(dest))
         assert result == dest
 
+    def test_download_bytes(self):
+        provider, client = self._make_provider()
+        body = MagicMock()
+        body.read.return_value = b"payload"
+        client.get_object.return_value = {"Body": body}
+        assert provider.download_bytes("bucket", "data/file.grd") == b"payload"
+        client.get_object.assert_called_once_with(Bucket="bucket", Key="data/file.grd")
+
     def test_list_objects_empty_page(self):
         provider, client = self._make_provider()
         paginator = MagicMock()
@@ -203,6 +220,56 @@ class TestS3StorageProvider:
         objects = provider.list_objects("bucket", "data/")
         assert objects == []
 
+    def test_list_objects_parallel_fans_out(self):
+        provider, client = self._make_provider()
+        paginator = MagicMock()
+        client.get_paginator.return_value = paginator
+
+        def paginate(Bucket, Prefix, Delimiter=None):
+            if Delimiter == "/":
+                # Sub-prefixes split across probe pages, so a truncated
+                # first response must not drop the later ones
+                return [
+                    {
+                        "CommonPrefixes": [{"Prefix": "data/a/"}],
+                        "Contents": [{"Key": "data/top.grd", "Size": 10}],
+                    },
+                    {"CommonPrefixes": [{"Prefix": "data/b/"}]},
+                ]
+            return [{"Contents": [{"Key": f"{Prefix}file.grd", "Size": 1}]}]
+
+        paginator.paginate.side_effect = paginate
+
+        objects = provider.list_objects("bucket", "data/", parallel=True)
+        assert [o.key for o in objects] == [
+            "data/a/file.grd", "data/b/file.grd", "data/top.grd",
+        ]
+        assert paginator.paginate.call_count == 3
+
+    def test_download_many(self, tmp_path):
+        provider, client = self._make_provider()
+        keys = ["data/a.grd", "data/b.grd", "data/c.grd"]
+        paths = provider.download_many("bucket", keys, tmp_path)
+        assert paths == [tmp_path / "a.grd", tmp_path / "b.grd", tmp_path / "c.grd"]
+        assert client.download_file.call_count == 3
+
+    def test_download_many_empty(self, tmp_path):
+        provider, client = self._make_provider()
+        assert provider.download_many("bucket", [], tmp_path) == []
+        client.download_file.assert_not_called()
+
+    def test_list_objects_parallel_no_subprefixes(self):
+        provider, client = self._make_provider()
+        paginator = MagicMock()
+        client.get_paginator.return_value = paginator
+        paginator.paginate.return_value = [
+            {"Contents": [{"Key": "data/only.grd", "Size": 5}]}
+        ]
+        objects = provider.list_objects("bucket", "data/", parallel=True)
+        assert [o.key for o in objects] == ["data/only.grd"]
+        # The probe already listed everything; no second listing pass
+        assert paginator.paginate.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # AzureBlobStorageProvider (mocked)
@@ -264,7 +331,7 @@ class TestAzureBlobStorageProvider:
         blob_client = MagicMock()
         client.get_blob_client.return_value = blob_client
         download_stream = MagicMock()
-        download_stream.readall.return_value = b"\x00" * 100
+        download_stream.chunks.return_value = iter([b"\x00" * 60, b"\x00" * 40])
         blob_client.download_blob.return_value = download_stream
 
         dest = tmp_path / "downloaded.grd"
@@ -272,6 +339,13 @@ class TestAzureBlobStorageProvider:
         assert result == dest
         assert dest.read_bytes() == b"\x00" * 100
 
+    def test_download_bytes(self):
+        provider, client = self._make_provider()
+        blob_client = MagicMock()
+        client.get_blob_client.return_value = blob_client
+        blob_client.download_blob.return_value.readall.return_value = b"payload"
+        assert provider.download_bytes("container", "data/file.grd") == b"payload"
+
 
 # ---------------------------------------------------------------------------
 # DirectoryScanner cloud integration
@@ -292,25 +366,15 @@ class TestDirectoryScannerCloud:
         payload = struct.pack(f"<{len(values)}f", *values)
         return header + payload
 
-    def test_scan_cloud_s3(self, tmp_path):
+    def test_scan_cloud_s3(self):
         """Scan an S3 URI using a mock provider."""
         data = self._surfer6_bytes()
 
-        # Write a real file so scan_file works on it
-        local_file = tmp_path / "sample.grd"
-        local_file.write_bytes(data)
-
         provider = MagicMock(spec=CloudStorageProvider)
         provider.list_objects.return_value = [
             CloudObject(key="surveys/sample.grd", size=len(data)),
         ]
-
-        def fake_download(bucket, key, dest):
-            dest = Path(dest)
-            dest.write_bytes(data)
-            return dest
-
-        provider.download.side_effect = fake_download
+        provider.download_bytes.return_value = data
 
         scanner = DirectoryScanner(cloud_provider=provider)
         reports = scanner.scan_cloud("s3://my-bucket/surveys/")
@@ -362,7 +426,7 @@ class TestDirectoryScannerCloud:
         provider.list_objects.return_value = [
             CloudObject(key="broken.grd", size=100),
         ]
-        provider.download.side_effect = Exception("Network error")
+        provider.download_bytes.side_effect = Exception("Network error")
 
         scanner = DirectoryScanner(cloud_provider=provider)
         reports = scanner.scan_cloud("s3://bucket/")
@@ -370,21 +434,13 @@ class TestDirectoryScannerCloud:
         assert len(reports) == 1
         assert any("Cloud download/analysis error" in e for e in reports[0].errors)
 
-    def test_scan_cloud_az_uri(self, tmp_path):
+    def test_scan_cloud_az_uri(self):
         """Scan an Azure URI using a mock provider."""
-        data = b"\x00" * 100
-
         provider = MagicMock(spec=CloudStorageProvider)
         provider.list_objects.return_value = [
             CloudObject(key="data/file.bin", size=100),
         ]
-
-        def fake_download(bucket, key, dest):
-            dest = Path(dest)
-            dest.write_bytes(data)
-            return dest
-
-        provider.download.side_effect = fake_download
+        provider.download_bytes.return_value = b"\x00" * 100
 
         scanner = DirectoryScanner(cloud_provider=provider)
         reports = scanner.scan_cloud("az://mycontainer/data/")
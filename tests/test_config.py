@@ -61,6 +61,35 @@ class TestFormatConfig:
         cfg = FormatConfig(name="test", data_dtype="ibm_float64")
         assert cfg.data_bit_width == 64
 
+    def test_compile_header(self):
+        import struct
+
+        cfg = FormatConfig(
+            name="test",
+            endian="little",
+            fields=[
+                FieldDefinition(name="magic", offset=0, size=4, dtype="bytes"),
+                FieldDefinition(name="nx", offset=4, size=2, dtype="uint16"),
+                FieldDefinition(name="xlo", offset=8, size=8, dtype="float64"),
+            ],
+        )
+        s = cfg.compile_header()
+        data = b"DSBB" + struct.pack("<H", 10) + b"\x00\x00" + struct.pack("<d", 1.5)
+        assert s.unpack_from(data) == (b"DSBB", 10, 1.5)
+        # Compiled Struct is cached on the instance
+        assert cfg.compile_header() is s
+
+    def test_compile_header_overlap_raises(self):
+        cfg = FormatConfig(
+            name="test",
+            fields=[
+                FieldDefinition(name="a", offset=0, size=4, dtype="uint32"),
+                FieldDefinition(name="b", offset=2, size=4, dtype="uint32"),
+            ],
+        )
+        with pytest.raises(ValueError, match="Overlapping"):
+            cfg.compile_header()
+
 
 class TestLoadConfig:
     def test_default_config_loads(self):
@@ -100,3 +129,14 @@ formats:
         assert configs[0].name == "Test Format"
         assert configs[0].magic_bytes == b"\xaa\xbb"
         assert configs[0].data_bit_width == 16
+
+    def test_cache_invalidates_on_edit(self, tmp_path):
+        p = tmp_path / "test.yaml"
+        p.write_text('formats:\n  - name: "First"\n')
+        assert load_config(p)[0].name == "First"
+
+        import os
+        p.write_text('formats:\n  - name: "Second"\n')
+        # Force a distinct mtime even on coarse-grained filesystems
+        os.utime(p, ns=(os.stat(p).st_atime_ns, os.stat(p).st_mtime_ns + 1))
+        assert load_config(p)[0].name == "Second"
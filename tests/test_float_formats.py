@@ -9,6 +9,7 @@ from geodatarev.float_formats import (
     swap_middle_endian_32,
     swap_middle_endian_64,
     reorder_bytes,
+    reorder_array,
     vax_f_to_ieee,
     vax_d_to_ieee,
     vax_g_to_ieee,
@@ -61,6 +62,28 @@ class TestEndianness:
         with pytest.raises(ValueError):
             reorder_bytes(b"\x00\x00\x00\x00", "xyz")
 
+    def test_reorder_array_big(self):
+        data = bytes([3, 2, 1, 0, 7, 6, 5, 4])
+        assert reorder_array(data, "big", 4) == bytes(range(8))
+
+    def test_reorder_array_middle(self):
+        data = bytes([2, 3, 0, 1, 6, 7, 4, 5])
+        assert reorder_array(data, "middle", 4) == bytes(range(8))
+
+    def test_reorder_array_matches_per_element(self):
+        data = bytes(range(16))
+        for endian in ("little", "big", "middle"):
+            for size in (2, 4, 8):
+                expected = b"".join(
+                    reorder_bytes(data[i:i + size], endian)
+                    for i in range(0, 16, size)
+                )
+                assert reorder_array(data, endian, size) == expected
+
+    def test_reorder_array_misaligned(self):
+        with pytest.raises(ValueError, match="not a multiple"):
+            reorder_array(b"\x00\x01\x02", "big", 4)
+
 
 class TestVAXFloat:
     def test_vax_f_zero(self):
@@ -116,6 +139,75 @@ class TestIBMFloat:
             ibm_float64_to_ieee(b"\x00" * 4)
 
 
+class TestVAXFloatArrays:
+    @staticmethod
+    def _random_words(n, size, seed=0):
+        import random
+        rng = random.Random(seed)
+        return b"".join(bytes(rng.randrange(256) for _ in range(size)) for _ in range(n))
+
+    def test_vax_f_array_matches_scalar(self):
+        pytest.importorskip("numpy")
+        from geodatarev.float_formats import vax_f_array
+
+        data = b"\x00" * 4 + self._random_words(32, 4)
+        expected = [vax_f_to_ieee(data[i * 4:(i + 1) * 4]) for i in range(33)]
+        assert vax_f_array(data).tolist() == expected
+
+    def test_vax_d_array_matches_scalar(self):
+        pytest.importorskip("numpy")
+        from geodatarev.float_formats import vax_d_array
+
+        data = b"\x00" * 8 + self._random_words(32, 8, seed=1)
+        expected = [vax_d_to_ieee(data[i * 8:(i + 1) * 8]) for i in range(33)]
+        assert vax_d_array(data).tolist() == expected
+
+    def test_vax_g_array_matches_scalar(self):
+        pytest.importorskip("numpy")
+        from geodatarev.float_formats import vax_g_array
+
+        data = b"\x00" * 8 + self._random_words(32, 8, seed=2)
+        expected = [vax_g_to_ieee(data[i * 8:(i + 1) * 8]) for i in range(33)]
+        assert vax_g_array(data).tolist() == expected
+
+
+class TestIBMFloatArrays:
+    def test_ibm_float32_array_matches_scalar(self):
+        np = pytest.importorskip("numpy")
+        from geodatarev.float_formats import ibm_float32_array
+
+        words = [
+            (65 << 24) | 0x100000,             # 1.0
+            (1 << 31) | (65 << 24) | 0x100000,  # -1.0
+            0,                                  # 0.0
+            (70 << 24) | 0x123456,
+        ]
+        data = b"".join(struct.pack(">I", w) for w in words)
+        expected = [ibm_float32_to_ieee(data[i * 4:(i + 1) * 4]) for i in range(4)]
+        assert ibm_float32_array(data).tolist() == expected
+
+    def test_ibm_float64_array_matches_scalar(self):
+        np = pytest.importorskip("numpy")
+        from geodatarev.float_formats import ibm_float64_array
+
+        words = [
+            (65 << 56) | (1 << 52),  # 1.0
+            (1 << 63) | (65 << 56) | (1 << 52),
+            0,
+            (70 << 56) | 0x123456789ABC,
+        ]
+        data = b"".join(struct.pack(">Q", w) for w in words)
+        expected = [ibm_float64_to_ieee(data[i * 8:(i + 1) * 8]) for i in range(4)]
+        assert ibm_float64_array(data).tolist() == expected
+
+    def test_decode_array_large_ibm(self):
+        pytest.importorskip("numpy")
+        data = struct.pack(">I", (65 << 24) | 0x100000) * 100
+        result = decode_array(data, "ibm_float32")
+        assert len(result) == 100
+        assert all(abs(v - 1.0) < 1e-6 for v in result)
+
+
 class TestDecodeValue:
     def test_uint8(self):
         assert decode_value(b"\xff", "uint8") == 255
@@ -198,3 +290,21 @@ class TestDecodeArray:
     def test_unsupported_dtype(self):
         with pytest.raises(ValueError, match="Unsupported dtype"):
             decode_array(b"\x00", "complex128")
+
+    def test_as_numpy_zero_copy(self):
+        np = pytest.importorskip("numpy")
+        data = struct.pack("<4f", 1.0, 2.0, 3.0, 4.0)
+        result = decode_array(data, "float32", "little", as_numpy=True)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_decode_array_np_middle_endian(self):
+        np = pytest.importorskip("numpy")
+        from geodatarev.float_formats import decode_array_np
+
+        le = struct.pack("<2I", 1, 70000)
+        middle = b"".join(
+            bytes([le[i + 2], le[i + 3], le[i], le[i + 1]]) for i in (0, 4)
+        )
+        result = decode_array_np(middle, "uint32", "middle")
+        assert result.tolist() == [1, 70000]
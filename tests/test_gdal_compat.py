@@ -11,12 +11,21 @@ from geodatarev.gdal_compat import (
     EXTENSION_DRIVER_MAP,
     GDAL_DRIVER_MAP,
     GDALCheckResult,
+    _reset_gdal_cache,
     check_gdal_available,
     get_old_gdal_strategy,
     try_gdal_open,
 )
 
 
+@pytest.fixture
+def fresh_gdal_cache():
+    """Reset the memoized GDAL probes around a sys.modules-patching test."""
+    _reset_gdal_cache()
+    yield
+    _reset_gdal_cache()
+
+
 class TestCheckGdalAvailable:
     def test_returns_dict(self):
         result = check_gdal_available()
@@ -25,7 +34,7 @@ class TestCheckGdalAvailable:
         assert "version" in result
         assert "error" in result
 
-    def test_unavailable_when_no_osgeo(self):
+    def test_unavailable_when_no_osgeo(self, fresh_gdal_cache):
         with mock.patch.dict("sys.modules", {"osgeo": None, "osgeo.gdal": None}):
             result = check_gdal_available()
             assert result["available"] is False
@@ -38,7 +47,7 @@ class TestTryGdalOpen:
         assert result.can_read is False
         assert "not found" in result.error.lower()
 
-    def test_no_gdal_returns_error(self, tmp_path):
+    def test_no_gdal_returns_error(self, tmp_path, fresh_gdal_cache):
         p = tmp_path / "test.bin"
         p.write_bytes(b"\x00" * 100)
         with mock.patch.dict("sys.modules", {"osgeo": None, "osgeo.gdal": None}):
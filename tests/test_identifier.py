@@ -5,7 +5,7 @@ import struct
 import pytest
 
 from geodatarev.config import FormatConfig
-from geodatarev.identifier import FileIdentifier
+from geodatarev.identifier import FileIdentifier, get_default_identifier, identify_file
 
 
 class TestFileIdentifier:
@@ -57,6 +57,13 @@ class TestFileIdentifier:
         assert len(matches) == 1
         assert matches[0].name == "GRD Format"
 
+    def test_default_identifier_is_shared(self):
+        assert get_default_identifier() is get_default_identifier()
+
+    def test_module_level_identify_file(self, surfer6_file):
+        names = [m.name for m in identify_file(surfer6_file)]
+        assert "Surfer 6 Binary Grid" in names
+
     def test_multiple_matches_sorted_by_length(self):
         configs = [
             FormatConfig(name="Short", magic_bytes=b"DS", magic_offset=0),
@@ -7,6 +7,7 @@ import pytest
 from geodatarev.parsers.surfer6 import Surfer6Parser
 from geodatarev.parsers.surfer7 import Surfer7Parser
 from geodatarev.parsers.ermapper import ERMapperParser, _parse_ers_header
+from geodatarev.parsers.zmap import ZMapParser
 
 
 class TestSurfer6Parser:
@@ -44,6 +45,12 @@ class TestSurfer6Parser:
         result = parser.parse(b"\x00" * 100)
         assert result.errors
 
+    def test_value_range_metadata(self, surfer6_bytes):
+        np = pytest.importorskip("numpy")
+        result = Surfer6Parser().parse(surfer6_bytes)
+        assert abs(result.metadata["value_min"] - 0.1) < 1e-5
+        assert abs(result.metadata["value_max"] - 0.6) < 1e-5
+
     def test_parse_truncated(self):
         header = b"DSBB" + struct.pack("<HH6d", 10, 10, 0, 1, 0, 1, 0, 1)
         # Only provide a few bytes of payload instead of 10*10*4 = 400
@@ -75,6 +82,13 @@ class TestSurfer7Parser:
         result = parser.parse_file(surfer7_file)
         assert result.header["nx"] == 2
 
+    def test_to_float32(self, surfer7_bytes):
+        np = pytest.importorskip("numpy")
+        result = Surfer7Parser().parse(surfer7_bytes)
+        assert result.data.dtype == np.float64
+        assert result.to_float32() is result
+        assert result.data.dtype == np.float32
+
 
 class TestERMapperParser:
     def test_can_parse(self, ers_header_bytes):
@@ -99,6 +113,40 @@ class TestERMapperParser:
         assert result.shape == (200, 100)
 
 
+class TestZMapParser:
+    def test_can_parse(self, zmap_bytes):
+        parser = ZMapParser()
+        assert parser.can_parse(zmap_bytes)
+
+    def test_parse(self, zmap_bytes):
+        parser = ZMapParser()
+        result = parser.parse(zmap_bytes)
+        assert result.format_name == "ZMap+ ASCII Grid"
+        assert result.shape == (2, 3)
+        assert len(result.data) == 6
+        assert abs(result.data[0] - 1.0) < 1e-10
+        assert not result.errors
+
+    def test_parse_file(self, zmap_file):
+        # Regression test: parse_file hands parse an mmap, which has no
+        # decode of its own
+        parser = ZMapParser()
+        result = parser.parse_file(zmap_file)
+        assert result.shape == (2, 3)
+        assert len(result.data) == 6
+        assert not result.errors
+
+    def test_parse_indented_delimiters(self, zmap_bytes):
+        # Some writers indent the @ header delimiters
+        indented = b"\n".join(
+            b"  " + line if line.startswith(b"@") else line
+            for line in zmap_bytes.splitlines()
+        )
+        result = ZMapParser().parse(indented)
+        assert result.shape == (2, 3)
+        assert len(result.data) == 6
+
+
 class TestERSHeaderParser:
     def test_parse_simple(self):
         text = """\
@@ -133,3 +181,16 @@ Block End
         assert result["Block"]["IntVal"] == 42
         assert abs(result["Block"]["FloatVal"] - 3.14) < 0.001
         assert result["Block"]["StrVal"] == "hello"
+
+    def test_unusual_numeric_spellings(self):
+        text = """\
+Block Begin
+    BareFraction = .5
+    TrailingDot = 5.
+    ExplicitPlus = +3
+Block End
+"""
+        result = _parse_ers_header(text)
+        assert result["Block"]["BareFraction"] == 0.5
+        assert result["Block"]["TrailingDot"] == 5.0
+        assert result["Block"]["ExplicitPlus"] == 3
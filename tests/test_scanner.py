@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from geodatarev.scanner import DirectoryScanner, FileReport
+from geodatarev.scanner import DirectoryScanner, FileReport, read_headers
 
 
 class TestDirectoryScanner:
@@ -18,6 +18,34 @@ class TestDirectoryScanner:
         assert report.parse_result is not None
         assert report.parse_result.header["nx"] == 3
 
+    def test_scan_file_ers(self, ers_file):
+        # Text parsers must cope with the scanner's mmap'd buffer
+        scanner = DirectoryScanner()
+        report = scanner.scan_file(ers_file)
+        assert report.parse_result is not None
+        assert report.parse_result.format_name == "ER Mapper"
+        assert report.parse_result.shape == (200, 100)
+        assert not report.parse_result.errors
+
+    def test_scan_file_ers_companion_binary(self, tmp_path, ers_header_bytes):
+        # Local scans must still run the path-aware companion discovery
+        header = tmp_path / "raster.ers"
+        header.write_bytes(ers_header_bytes)
+        binary = tmp_path / "raster"
+        binary.write_bytes(b"\x00" * 64)
+        report = DirectoryScanner().scan_file(header)
+        assert report.parse_result is not None
+        assert report.parse_result.metadata["binary_path"] == str(binary)
+        assert report.parse_result.metadata["binary_size"] == 64
+
+    def test_scan_file_zmap_dat(self, zmap_file):
+        scanner = DirectoryScanner()
+        report = scanner.scan_file(zmap_file)
+        assert report.parse_result is not None
+        assert report.parse_result.format_name == "ZMap+ ASCII Grid"
+        assert len(report.parse_result.data) == 6
+        assert not report.parse_result.errors
+
     def test_scan_nonexistent(self, tmp_path):
         scanner = DirectoryScanner()
         report = scanner.scan_file(tmp_path / "nope.bin")
@@ -46,6 +74,14 @@ class TestDirectoryScanner:
         assert len(reports) == 1
         assert reports[0].path.endswith(".grd")
 
+    def test_scan_directory_parallel_keeps_order(self, tmp_path, surfer6_bytes):
+        for name in ("c.grd", "a.grd", "b.grd"):
+            (tmp_path / name).write_bytes(surfer6_bytes)
+        scanner = DirectoryScanner(max_workers=4)
+        reports = scanner.scan_directory(tmp_path)
+        names = [r.path.rsplit("/", 1)[-1] for r in reports]
+        assert names == ["a.grd", "b.grd", "c.grd"]
+
     def test_scan_directory_recursive(self, tmp_path, surfer6_bytes):
         sub = tmp_path / "sub"
         sub.mkdir()
@@ -65,3 +101,20 @@ class TestDirectoryScanner:
         paths = [r.path for r in reports]
         assert any("top.grd" in p for p in paths)
         assert not any("deep.grd" in p for p in paths)
+
+
+class TestReadHeaders:
+    def test_reads_in_order(self, tmp_path):
+        a = tmp_path / "a.bin"
+        b = tmp_path / "b.bin"
+        a.write_bytes(b"AAAA" * 2000)
+        b.write_bytes(b"BB")
+        headers = read_headers([a, b], nbytes=16)
+        assert headers == [b"AAAA" * 4, b"BB"]
+
+    def test_unreadable_yields_empty(self, tmp_path):
+        headers = read_headers([tmp_path / "missing.bin"])
+        assert headers == [b""]
+
+    def test_empty_list(self):
+        assert read_headers([]) == []